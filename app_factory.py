@@ -2,10 +2,12 @@
 import os
 import secrets
 from flask import Flask, redirect, url_for, request, Response, abort, jsonify
+from flask.globals import app_ctx
 from dotenv import load_dotenv
 from flask_wtf.csrf import CSRFProtect
 from flask_login import LoginManager
 from config import Config, TestConfig, DebugConfig, DATETIME_FORMATS
+from sqlalchemy.orm import scoped_session
 from database import init_db, get_db, teardown_db
 from utils.timezone import app_now
 from routes.users import user_bp
@@ -16,6 +18,7 @@ from routes.media import media_bp
 from services.user_service import UserService
 from utils.populate_database import populate_database
 from utils.svg_helper import load_svg_icons
+from utils.http import gzip_response
 from utils.error_handlers import register_media_error_handlers, register_general_error_handlers
 
 def create_app(login_manager=LoginManager(), config_override=dict()):
@@ -111,10 +114,17 @@ def create_app(login_manager=LoginManager(), config_override=dict()):
 
     app.config.update(config_override)
 
+    # Clients read JSON responses by key, so skip sorting every dict jsonify serialises
+    app.json.sort_keys = False
+
     # Initialize CSRF protection, the token will be available in jinja templates via {{ csrf_token() }}
     csrf = CSRFProtect(app)
-    Session = init_db(app.config['SQLALCHEMY_DATABASE_URI'])
+    Session = init_db(app.config['SQLALCHEMY_DATABASE_URI'], app.config.get('SQLALCHEMY_ENGINE_OPTIONS'))
     app.config['SQLALCHEMY_SESSION'] = Session
+    # Session registry used by get_db, scoped to the app context rather than the thread so a nested
+    # app context tearing down can't remove the outer context's session
+    app.config['SQLALCHEMY_SCOPED_SESSION'] = scoped_session(Session, scopefunc=lambda: id(app_ctx._get_current_object()))
+    app.teardown_appcontext(teardown_db)
 
     # Initialize Libcloud storage driver
     from libcloud.storage.types import Provider
@@ -201,7 +211,7 @@ def create_app(login_manager=LoginManager(), config_override=dict()):
     
     @login_manager.user_loader
     def load_user(user_id):
-        _return = UserService(get_db()).get_user_by_id(user_id)
+        _return = UserService(get_db()).get_user_by_id(int(user_id))
         teardown_db()
         return _return
     
@@ -244,6 +254,9 @@ def create_app(login_manager=LoginManager(), config_override=dict()):
         from routes.testing import testing_bp
         app.register_blueprint(testing_bp)
 
+    # Compress JSON list responses for clients that accept gzip
+    app.after_request(gzip_response)
+
     # Register global error handlers
     register_media_error_handlers(app)
     register_general_error_handlers(app, login_manager)
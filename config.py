@@ -49,6 +49,14 @@ class Config:
     SECRET_KEY = os.environ.get('SECRET_KEY') or secrets.token_bytes(32)
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or f'sqlite:///{os.path.join("instance", "cleanit.db")}'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # Connection pool per worker process (gunicorn runs 4 workers x 2 threads in docker-entrypoint.sh)
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_size': int(os.getenv('DB_POOL_SIZE', 5)),
+        'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', 10)),
+        'pool_recycle': 1800,  # Recycle connections before server-side idle timeouts drop them
+        'pool_timeout': 30,  # Seconds a request waits for a free connection before erroring
+        'pool_pre_ping': True,  # Replace connections the database closed instead of failing the request
+    }
     
     # Cloud-first storage configuration
     STORAGE_PROVIDER = os.getenv('STORAGE_PROVIDER', 's3')  # Default to S3 for production
@@ -64,6 +72,9 @@ class Config:
     
     # For development/testing with local and temporary storage
     UPLOAD_FOLDER = os.getenv('UPLOAD_FOLDER', './uploads')
+    # When nginx fronts the app, e.g. '/_protected/' mapped to UPLOAD_FOLDER by an internal location,
+    # local media is handed to it with X-Accel-Redirect instead of being streamed through Python
+    MEDIA_X_ACCEL_PREFIX = os.getenv('MEDIA_X_ACCEL_PREFIX')
     
     # Environment detection - used to determine runtime configuration
     # Valid values: 'production', 'debug', 'testing'
@@ -248,7 +248,8 @@ class JobController:
 
         all_teams = self.team_service.get_all_teams()
 
-        team = self.team_service.get_team(current_user.team_id)
+        # The user's team is already among all_teams, so pick it out rather than query it again
+        team = next((team for team in all_teams if team.id == current_user.team_id), None)
         team_leader_id = team.team_leader_id if team else None
         selected_date = session['selected_date'] # Use the string directly from session
         current_user.selected_date = selected_date
@@ -654,13 +655,7 @@ class JobController:
                     # Extract metadata if available
                     metadata = {}
                     try:
-                        import tempfile
-                        import os
-                        with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(file.filename)[1]) as tmp:
-                            file.save(tmp.name)
-                            tmp_path = tmp.name
-                            metadata = extract_metadata(tmp_path, media_type)
-                            os.unlink(tmp_path)
+                        metadata = extract_metadata(file, media_type)
                         current_app.logger.debug(f"Extracted metadata for {file.filename}: {metadata}")
                     except Exception as e:
                         # Metadata extraction is optional
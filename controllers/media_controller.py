@@ -19,9 +19,15 @@ from utils.media_utils import (
     MEDIA_TYPE_AUDIO
 )
 import logging
+import mimetypes
+from urllib.parse import quote
+from werkzeug.security import safe_join
 
 logger = logging.getLogger(__name__)
 
+# Stored filenames carry a timestamp and random suffix, so a served file never changes under its name
+MEDIA_CACHE_MAX_AGE = 365 * 24 * 60 * 60
+
 
 class MediaController:
     """
@@ -84,15 +90,7 @@ class MediaController:
             # Extract metadata if available
             metadata = {}
             try:
-                # For now, we need to save to temp file to extract metadata
-                # In production, this could be done differently
-                import tempfile
-                import os
-                with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(file.filename)[1]) as tmp:
-                    file.save(tmp.name)
-                    tmp_path = tmp.name
-                    metadata = extract_metadata(tmp_path, media_type)
-                    os.unlink(tmp_path)
+                metadata = extract_metadata(file, media_type)
             except Exception as e:
                 logger.warning(f"Failed to extract metadata: {e}")
             
@@ -193,8 +191,25 @@ class MediaController:
             }), 404
         
         upload_folder = current_app.config.get('UPLOAD_FOLDER', './uploads')
+
+        accel_prefix = current_app.config.get('MEDIA_X_ACCEL_PREFIX')
+        if accel_prefix:
+            # nginx sends the bytes from its internal location; only the path is checked here
+            if safe_join(upload_folder, filename) is None:
+                return jsonify({"error": "File not found or inaccessible"}), 404
+            response = current_app.response_class(
+                mimetype=mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+            )
+            # nginx decodes the URI, so spaces, % and ? in the filename must be percent-encoded
+            response.headers['X-Accel-Redirect'] = f"{accel_prefix.rstrip('/')}/{quote(filename)}"
+            # Same caching headers send_from_directory sets below
+            response.cache_control.public = True
+            response.cache_control.max_age = MEDIA_CACHE_MAX_AGE
+            return response
+
         try:
-            return send_from_directory(upload_folder, filename)
+            # conditional responses answer If-None-Match/If-Modified-Since with a 304 and no file read
+            return send_from_directory(upload_folder, filename, conditional=True, max_age=MEDIA_CACHE_MAX_AGE)
         except Exception as e:
             # Let the global error handler handle MediaNotFound
             # For other errors, return appropriate response
@@ -381,13 +381,7 @@ class PropertyController:
                     # Extract metadata if available
                     metadata = {}
                     try:
-                        import tempfile
-                        import os
-                        with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(file.filename)[1]) as tmp:
-                            file.save(tmp.name)
-                            tmp_path = tmp.name
-                            metadata = extract_metadata(tmp_path, media_type)
-                            os.unlink(tmp_path)
+                        metadata = extract_metadata(file, media_type)
                         current_app.logger.debug(f"Extracted metadata for {file.filename}: {metadata}")
                     except Exception as e:
                         # Metadata extraction is optional
@@ -1,19 +1,28 @@
 import os
-import random
 from time import timezone
-from sqlalchemy import create_engine, Column, Integer, String, ForeignKey, Date, Time, Boolean, UniqueConstraint, func, DateTime, select
-from sqlalchemy.orm import sessionmaker, declarative_base, relationship
+from sqlalchemy import create_engine, make_url, event, inspect, text, bindparam, update, Column, Integer, String, ForeignKey, Date, Time, Boolean, UniqueConstraint, func, DateTime, select, Index, Computed
+from sqlalchemy.schema import CreateColumn
+from sqlalchemy.orm import sessionmaker, DeclarativeBase, relationship, deferred
 from sqlalchemy.ext.hybrid import hybrid_property, hybrid_method
 from werkzeug.security import generate_password_hash
-from flask import g, current_app
+from flask import current_app
 from flask_login import UserMixin
 from datetime import date, time, timedelta, datetime
 
 from config import DATETIME_FORMATS
-from utils.timezone import to_app_tz
+from utils.timezone import to_app_tz, app_tz_is_utc, compile_strftime
 
 # Define the base for declarative models
-Base = declarative_base()
+class Base(DeclarativeBase):
+    pass
+
+# Display formatters compiled once from DATETIME_FORMATS; numeric formats avoid strftime per row
+_FORMAT_DATE = compile_strftime(DATETIME_FORMATS['DATE_FORMAT'])
+_FORMAT_TIME = compile_strftime(DATETIME_FORMATS['TIME_FORMAT'])
+_FORMAT_DATETIME = compile_strftime(DATETIME_FORMATS['DATETIME_FORMAT'])
+
+# Password hashing method passed to werkzeug; scrypt runs natively in OpenSSL via hashlib
+PASSWORD_HASH_METHOD = 'scrypt'
 
 # Define the User model
 class User(Base, UserMixin):
@@ -26,16 +35,17 @@ class User(Base, UserMixin):
     phone = Column(String, nullable=True)
     password_hash = Column(String, nullable=False)
     role = Column(String, nullable=False, default='user') # 'user', 'supervisor', 'admin'
-    team_id = Column(Integer, ForeignKey('teams.id'), nullable=True)
+    team_id = Column(Integer, ForeignKey('teams.id'), nullable=True, index=True)
     team = relationship("Team", back_populates="members", foreign_keys=[team_id])
     
-    assignments = relationship("Assignment", back_populates="user")
+    # Never lazy loaded: a busy user's full assignment history must be requested explicitly
+    assignments = relationship("Assignment", back_populates="user", lazy='raise_on_sql', passive_deletes=True)
 
     def __repr__(self):
-        return f"<User(id={self.id}, first_name='{self.first_name}', last_name='{self.last_name}', email='{self.email} role='{self.role}')>"
+        return f"<User(id={self.id}, first_name='{self.first_name}', last_name='{self.last_name}', email='{self.email}', role='{self.role}')>"
 
-    def set_password(self, password):
-        self.password_hash = generate_password_hash(password)
+    def set_password(self, password, method=PASSWORD_HASH_METHOD):
+        self.password_hash = generate_password_hash(password, method=method)
 
     @hybrid_property
     def full_name(self):
@@ -83,16 +93,22 @@ class Team(Base):
     assignments = relationship("Assignment", back_populates="team")
 
     def to_dict(self):
+        member_dicts = {member.id: member.to_dict() for member in self.members}
+        # The leader is normally a member, so reuse their dict rather than serialising them twice
+        team_leader = member_dicts.get(self.team_leader_id)
+        if team_leader is None and self.team_leader:
+            team_leader = self.team_leader.to_dict()
         return {
             'id': self.id,
             'name': self.name,
             'team_leader_id': self.team_leader_id,
-            'team_leader': self.team_leader.to_dict() if self.team_leader else None,
-            'members': [member.to_dict() for member in self.members]
+            'team_leader': team_leader,
+            'members': list(member_dicts.values())
         }
 
     def __repr__(self):
-        return f"<Team(id={self.id}, name='{self.name}', team_leader_id={self.team_leader_id}), members={self.members}>"
+        # Column values only: reading self.members here would lazy load the collection on every repr
+        return f"<Team(id={self.id}, name='{self.name}', team_leader_id={self.team_leader_id})>"
 
 class Job(Base):
     __tablename__ = 'jobs'
@@ -102,17 +118,29 @@ class Job(Base):
     end_date = Column(Date, nullable=False, default=lambda: date.today())
     start_time = Column(Time, nullable=False)
     arrival_datetime = Column(DateTime, nullable=True)
+    # UTC date of arrival_datetime, generated by the database. persisted=None lets each dialect pick:
+    # STORED on Postgres, VIRTUAL on SQLite, which can add and index it on an existing table
+    arrival_date = Column(Date, Computed('date(arrival_datetime)', persisted=None))
     end_time = Column(Time, nullable=False)
     description = Column(String)
     is_complete = Column(Boolean, default=False)
     job_type = Column(String)
-    report = Column(String) # Sensitive, only for Supervisor/admin
+    report = deferred(Column(String), group='sensitive') # Sensitive, only for Supervisor/admin. Deferred so job lists don't load it
+    duration_minutes = Column(Integer, nullable=True) # Maintained by the before_insert/before_update listeners
 
     property_id = Column(Integer, ForeignKey('properties.id'))
     property = relationship("Property", back_populates="jobs")
 
     assignments = relationship("Assignment", back_populates="job")
     job_media = relationship("JobMedia", back_populates="job")
+
+    # Property job lists filter on property_id and order by date then start_time;
+    # timetable queries range over date and order by date then start_time
+    __table_args__ = (
+        Index('ix_jobs_property_date', 'property_id', 'date', 'start_time'),
+        Index('ix_jobs_date_time', 'date', 'start_time'),
+        Index('ix_jobs_arrival_date', 'arrival_date'),
+    )
     
     @hybrid_property
     def same_day_arrival(self):
@@ -126,16 +154,6 @@ class Job(Base):
             return self.arrival_datetime and (self.arrival_date_in_app_tz - self.date_in_app_tz).days == 1
         return False
     
-    @hybrid_property
-    def arrival_date(self):
-        if self.arrival_datetime:
-            return self.arrival_datetime.date()
-        return None
-
-    @arrival_date.expression
-    def arrival_date(cls):
-        return func.date(cls.arrival_datetime)
-
     @hybrid_property
     def arrival_time_only(self):
         if self.arrival_datetime:
@@ -153,7 +171,7 @@ class Job(Base):
     @hybrid_property
     def display_date(self):
         # Instance-level: self.date is an actual date object
-        return to_app_tz(datetime.combine(self.date, self.start_time)).strftime(DATETIME_FORMATS['DATE_FORMAT'])
+        return _FORMAT_DATE(to_app_tz(datetime.combine(self.date, self.start_time)))
 
     @display_date.expression
     def display_date(cls):
@@ -163,7 +181,10 @@ class Job(Base):
     
     @hybrid_property
     def display_time(self):
-        return to_app_tz(datetime.combine(self.date, self.start_time)).strftime(DATETIME_FORMATS['TIME_FORMAT'])
+        # Stored times are UTC, so under a UTC app timezone they are already wall-clock times
+        if app_tz_is_utc():
+            return _FORMAT_TIME(self.start_time)
+        return _FORMAT_TIME(to_app_tz(datetime.combine(self.date, self.start_time)))
 
     @display_time.expression
     def display_time(cls):
@@ -171,11 +192,15 @@ class Job(Base):
     
     @hybrid_property
     def display_start_time(self):
-        return to_app_tz(datetime.combine(self.date, self.start_time)).strftime(DATETIME_FORMATS['TIME_FORMAT'])
+        if app_tz_is_utc():
+            return _FORMAT_TIME(self.start_time)
+        return _FORMAT_TIME(to_app_tz(datetime.combine(self.date, self.start_time)))
     
     @hybrid_property
     def display_end_time(self):
-        return to_app_tz(datetime.combine(self.date, self.end_time)).strftime(DATETIME_FORMATS['TIME_FORMAT'])
+        if app_tz_is_utc():
+            return _FORMAT_TIME(self.end_time)
+        return _FORMAT_TIME(to_app_tz(datetime.combine(self.date, self.end_time)))
 
     @display_end_time.expression
     def display_end_time(cls):
@@ -187,7 +212,7 @@ class Job(Base):
 
     @hybrid_property
     def display_arrival_time(self):
-        return to_app_tz(self.arrival_datetime).strftime(DATETIME_FORMATS['TIME_FORMAT']) if self.arrival_datetime else None
+        return _FORMAT_TIME(to_app_tz(self.arrival_datetime)) if self.arrival_datetime else None
 
     @display_arrival_time.expression
     def display_arrival_time(cls):
@@ -195,7 +220,7 @@ class Job(Base):
 
     @hybrid_property
     def display_arrival_date(self):
-        return to_app_tz(self.arrival_datetime).strftime(DATETIME_FORMATS['DATE_FORMAT']) if self.arrival_datetime else None
+        return _FORMAT_DATE(to_app_tz(self.arrival_datetime)) if self.arrival_datetime else None
 
     @display_arrival_date.expression
     def display_arrival_date(cls):
@@ -208,7 +233,7 @@ class Job(Base):
     
     @hybrid_property
     def display_arrival_datetime_strf(self):
-        return to_app_tz(self.arrival_datetime).strftime(DATETIME_FORMATS['DATETIME_FORMAT']) if self.arrival_datetime else None
+        return _FORMAT_DATETIME(to_app_tz(self.arrival_datetime)) if self.arrival_datetime else None
 
     @display_arrival_datetime.expression
     def display_arrival_datetime(cls):
@@ -269,38 +294,23 @@ class Job(Base):
     
     @hybrid_property
     def duration(self):
-        if self.start_time and self.end_time:
-            # Calculate duration using timezone-aware datetimes with correct dates
-            start_datetime_local = self.display_datetime  # Already timezone-aware in app timezone
-            end_datetime_local = self.display_end_datetime  # Already timezone-aware in app timezone with correct end_date
-            
-            # With proper end_date handling, end_datetime_local should always be >= start_datetime_local
-            # But keep safety check for backward compatibility with existing data
-            if end_datetime_local < start_datetime_local:
-                # This shouldn't happen with correct end_date, but handle for existing data
-                # where end_date might equal date incorrectly
-                end_datetime_local += timedelta(days=1)
-
-            duration_timedelta = end_datetime_local - start_datetime_local
-            total_minutes = int(duration_timedelta.total_seconds() / 60)
-            
-            hours = total_minutes // 60
-            minutes = total_minutes % 60
-            
-            if minutes > 0:
-                return f"{hours}h {minutes}m"
-            return f"{hours}h"
-        return None
+        """Format the stored duration_minutes, computing it for jobs that have not been flushed yet."""
+        total_minutes = self.duration_minutes
+        if total_minutes is None:
+            if not (self.start_time and self.end_time):
+                return None
+            total_minutes = calculate_duration_minutes(self.date, self.start_time, self.end_date, self.end_time)
+
+        hours, minutes = divmod(total_minutes, 60)
+
+        if minutes > 0:
+            return f"{hours}h {minutes}m"
+        return f"{hours}h"
 
     @duration.expression
     def duration(cls):
-        # This is a placeholder for a more complex SQL expression if needed
-        # For now, it returns a string representation, which is not directly sortable/filterable in SQL
-        # A more robust solution for SQL querying would involve storing duration or a calculated field
-        return func.printf('%dh %dm',
-                           (func.julianday(cls.end_time) - func.julianday(cls.start_time)) * 24,
-                           ((func.julianday(cls.end_time) - func.julianday(cls.start_time)) * 24 * 60) % 60
-                          )
+        # Class-level: sort and filter on the stored minutes rather than the formatted string
+        return cls.duration_minutes
 
     @hybrid_property
     def is_valid_date_range(self):
@@ -311,6 +321,42 @@ class Job(Base):
     def is_valid_date_range(cls):
         return cls.end_date >= cls.date
 
+def calculate_duration_minutes(date, start_time, end_date, end_time):
+    """
+    Calculate a job's duration in whole minutes from its UTC date and time columns.
+    The difference is taken between the app timezone datetimes so DST transitions
+    show the local wall-clock duration.
+
+    Args:
+        date (date): The UTC start date of the job.
+        start_time (time): The UTC start time of the job.
+        end_date (date): The UTC end date of the job.
+        end_time (time): The UTC end time of the job.
+
+    Returns:
+        int: The duration in minutes.
+    """
+    start_datetime_local = to_app_tz(datetime.combine(date, start_time))
+    end_datetime_local = to_app_tz(datetime.combine(end_date or date, end_time))
+
+    # With proper end_date handling, end_datetime_local should always be >= start_datetime_local
+    # But keep safety check for backward compatibility with existing data
+    if end_datetime_local < start_datetime_local:
+        # This shouldn't happen with correct end_date, but handle for existing data
+        # where end_date might equal date incorrectly
+        end_datetime_local += timedelta(days=1)
+
+    return (end_datetime_local - start_datetime_local) // timedelta(minutes=1)
+
+@event.listens_for(Job, 'before_insert')
+@event.listens_for(Job, 'before_update')
+def set_job_duration_minutes(mapper, connection, target):
+    """Store the job duration on write so reads don't repeat the datetime arithmetic."""
+    if target.start_time and target.end_time:
+        target.duration_minutes = calculate_duration_minutes(target.date, target.start_time, target.end_date, target.end_time)
+    else:
+        target.duration_minutes = None
+
 class Assignment(Base):
     __tablename__ = 'assignments'
     id = Column(Integer, primary_key=True)
@@ -319,11 +365,15 @@ class Assignment(Base):
     team_id = Column(Integer, ForeignKey('teams.id'), nullable=True) # For assigned teams
 
     job = relationship("Job", back_populates="assignments")
-    user = relationship("User", foreign_keys=[user_id])  
-    team = relationship("Team", foreign_keys=[team_id])
+    user = relationship("User", foreign_keys=[user_id], back_populates="assignments")
+    team = relationship("Team", foreign_keys=[team_id], back_populates="assignments")
 
+    # The unique constraints already index job_id lookups; the reverse (user_id, job_id) and
+    # (team_id, job_id) indexes cover "jobs for a user/team" without touching the table
     __table_args__ = (UniqueConstraint('job_id', 'user_id', name='_job_user_uc'),
                       UniqueConstraint('job_id', 'team_id', name='_job_team_uc'),
+                      Index('ix_assignments_user_job', 'user_id', 'job_id'),
+                      Index('ix_assignments_team_job', 'team_id', 'job_id'),
                       )
 
 class Media(Base):
@@ -353,7 +403,7 @@ class Media(Base):
     
     @hybrid_property
     def display_upload_date(self):
-        return to_app_tz(self.upload_date).strftime(DATETIME_FORMATS['DATE_FORMAT'])
+        return _FORMAT_DATE(to_app_tz(self.upload_date))
 
 class PropertyMedia(Base):
     __tablename__ = 'property_media'
@@ -365,7 +415,9 @@ class PropertyMedia(Base):
     property = relationship("Property", back_populates="property_media")
     media = relationship("Media", back_populates="property_media")
     
-    __table_args__ = (UniqueConstraint('property_id', 'media_id', name='_property_media_uc'),)
+    # The unique constraint covers lookups by property_id; deleting a media item filters on media_id
+    __table_args__ = (UniqueConstraint('property_id', 'media_id', name='_property_media_uc'),
+                      Index('ix_property_media_media', 'media_id'),)
     
     def __repr__(self):
         return f"<PropertyMedia(id={self.id}, property_id={self.property_id}, media_id={self.media_id})>"
@@ -380,36 +432,131 @@ class JobMedia(Base):
     job = relationship("Job", back_populates="job_media")
     media = relationship("Media", back_populates="job_media")
     
-    __table_args__ = (UniqueConstraint('job_id', 'media_id', name='_job_media_uc'),)
+    # The unique constraint covers lookups by job_id; deleting a media item filters on media_id
+    __table_args__ = (UniqueConstraint('job_id', 'media_id', name='_job_media_uc'),
+                      Index('ix_job_media_media', 'media_id'),)
     
     def __repr__(self):
         return f"<JobMedia(id={self.id}, job_id={self.job_id}, media_id={self.media_id})>"
 
+# Applied to every new SQLite connection. WAL lets readers proceed while a write is in
+# progress and synchronous=NORMAL only syncs at checkpoints instead of on every commit.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Connect event listener that tunes each new SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+def _upgrade_jobs_table(engine):
+    """
+    Adds Job columns introduced after the jobs table was first created.
+    create_all never alters an existing table and the repo has no migrations, so without
+    this step every Job query against an older database fails on the missing columns.
+    Safe to run repeatedly: columns that already exist are left untouched.
+    """
+    jobs = Job.__table__
+    existing = {column['name'] for column in inspect(engine).get_columns(jobs.name)}
+    missing = [column for column in (jobs.c.duration_minutes, jobs.c.arrival_date) if column.name not in existing]
+    if not missing:
+        return
+
+    with engine.begin() as connection:
+        for column in missing:
+            column_ddl = CreateColumn(column).compile(dialect=engine.dialect)
+            connection.execute(text(f"ALTER TABLE {jobs.name} ADD COLUMN {column_ddl}"))
+
+        if jobs.c.duration_minutes in missing:
+            # Backfill rows written before the before_insert/before_update listeners existed
+            rows = connection.execute(
+                select(jobs.c.id, jobs.c.date, jobs.c.start_time, jobs.c.end_date, jobs.c.end_time)
+                .where(jobs.c.start_time.is_not(None), jobs.c.end_time.is_not(None))
+            ).all()
+            if rows:
+                connection.execute(
+                    update(jobs).where(jobs.c.id == bindparam('job_id')).values(duration_minutes=bindparam('minutes')),
+                    [{'job_id': row.id, 'minutes': calculate_duration_minutes(row.date, row.start_time, row.end_date, row.end_time)}
+                     for row in rows]
+                )
+
+def _create_missing_indexes(engine):
+    """
+    Creates model indexes missing from tables that already existed.
+    create_all only builds indexes together with a new table, so indexes added to the
+    models later would otherwise never reach an existing database. Safe to run repeatedly.
+    """
+    with engine.begin() as connection:
+        for table in Base.metadata.tables.values():
+            for index in table.indexes:
+                index.create(connection, checkfirst=True)
+
 # Database initialization function
-def init_db(database_uri: str):
+# Pool sizing options that only apply to QueuePool engines
+POOL_SIZING_OPTIONS = ('pool_size', 'max_overflow', 'pool_recycle', 'pool_timeout')
+
+# Session factories built by init_db, keyed on the database URI and engine options
+_session_factories = {}
+
+def _engine_cache_key(database_uri, engine_options):
+    """
+    Returns the _session_factories key for a URI and its engine options, or None when an
+    option value such as connect_args is unhashable and the engine can't be shared.
+    """
+    cache_key = (database_uri, tuple(sorted(engine_options.items())))
+    try:
+        hash(cache_key)
+    except TypeError:
+        return None
+    return cache_key
+
+def init_db(database_uri: str, engine_options: dict = None):
     """
     Initializes the database and creates all tables.
+    Repeat calls with the same URI and options reuse the engine, its pool and the
+    already created schema instead of building and introspecting them again.
 
     Args:
-        database_path (str): The path to the SQLite database file.
-        seed_data (bool): If True, the database will be seeded with deterministic test data.
+        database_uri (str): The SQLAlchemy database URI.
+        engine_options (dict, optional): Extra keyword arguments for create_engine, e.g. pool sizing.
     """
-    engine = create_engine(database_uri)
+    engine_options = dict(engine_options or {})
+    url = make_url(database_uri)
+    in_memory = url.get_backend_name() == 'sqlite' and url.database in (None, '', ':memory:')
+    if in_memory:
+        # In-memory SQLite uses a single-connection pool, so pool sizing does not apply
+        for option in POOL_SIZING_OPTIONS:
+            engine_options.pop(option, None)
+
+    # Each in-memory engine is its own database, so those are never shared
+    cache_key = None if in_memory else _engine_cache_key(database_uri, engine_options)
+    if cache_key in _session_factories:
+        return _session_factories[cache_key]
+
+    engine = create_engine(database_uri, **engine_options)
+    if engine.dialect.name == 'sqlite':
+        event.listen(engine, 'connect', _set_sqlite_pragmas)
     Base.metadata.create_all(engine)
+    _upgrade_jobs_table(engine)
+    _create_missing_indexes(engine)
     Session = sessionmaker(bind=engine)
 
+    if cache_key is not None:
+        _session_factories[cache_key] = Session
     return Session
 
 # Helper functions for database session management
 def get_db():
-    """Helper function to get or create a database connection for the current request."""
-    if 'db' not in g:
-        Session = current_app.config['SQLALCHEMY_SESSION']
-        g.db = Session()
-    return g.db
+    """Helper function to get or create the scoped database session for the current request."""
+    return current_app.config['SQLALCHEMY_SCOPED_SESSION']()
 
 def teardown_db(exception=None):
-    """Closes the database session at the end of a request."""
-    db = g.pop('db', None)
-    if db is not None:
-        db.close()
+    """Closes the scoped database session at the end of a request."""
+    current_app.config['SQLALCHEMY_SCOPED_SESSION'].remove()
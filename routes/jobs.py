@@ -1,6 +1,6 @@
 from flask import Blueprint, request, g
 from flask_login import login_required
-from database import get_db, teardown_db
+from utils.request_cache import request_cached_controller
 from services.job_service import JobService
 from services.team_service import TeamService
 from services.user_service import UserService
@@ -12,13 +12,11 @@ from controllers.jobs_controller import JobController
 
 job_bp = Blueprint('job', __name__, url_prefix='/jobs')
 
-@job_bp.teardown_request
-def teardown_job_db(exception=None):
-    teardown_db(exception)
-
 def get_job_controller():
-    """Create and return a JobController instance with request-level database session."""
-    db_session = get_db()
+    """Return the request's JobController, building it and its services on first use."""
+    return request_cached_controller('job_controller', _build_job_controller)
+
+def _build_job_controller(db_session):
     job_service = JobService(db_session)
     team_service = TeamService(db_session)
     user_service = UserService(db_session)
@@ -26,7 +24,7 @@ def get_job_controller():
     assignment_service = AssignmentService(db_session)
     media_service = MediaService(db_session)
     job_helper = JobHelper(job_service, team_service, assignment_service)
-    controller = JobController(
+    return JobController(
         job_service=job_service,
         team_service=team_service,
         user_service=user_service,
@@ -35,7 +33,6 @@ def get_job_controller():
         job_helper=job_helper,
         media_service=media_service
     )
-    return controller
 
 @job_bp.route('/', methods=['GET'])
 @login_required
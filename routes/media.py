@@ -3,28 +3,23 @@ Media routes for handling media-related API endpoints.
 """
 from flask import Blueprint, request, g
 from flask_login import login_required
-from database import get_db, teardown_db
+from utils.request_cache import request_cached_controller
 from services.media_service import MediaService
 from controllers.media_controller import MediaController
 
 media_bp = Blueprint('media', __name__, url_prefix='/media')
 
-@media_bp.teardown_request
-def teardown_media_db(exception=None):
-    """Ensure database session is torn down after each request."""
-    teardown_db(exception)
-
 def get_media_controller():
     """
-    Create and return a MediaController instance with request-level database session.
+    Return the request's MediaController, creating it with the request-level database session on first use.
     
     Returns:
         MediaController: Controller instance with MediaService dependency
     """
-    db_session = get_db()
-    media_service = MediaService(db_session)
-    controller = MediaController(media_service=media_service)
-    return controller
+    return request_cached_controller(
+        'media_controller',
+        lambda db_session: MediaController(media_service=MediaService(db_session))
+    )
 
 @media_bp.route('/upload', methods=['POST'])
 @login_required
@@ -1,29 +1,23 @@
 from flask import Blueprint, request
 from flask_login import login_required
 from controllers.property_controller import PropertyController
-from database import get_db, teardown_db
+from utils.request_cache import request_cached_controller
 from services.property_service import PropertyService
 from services.job_service import JobService
 from services.media_service import MediaService
 
 properties_bp = Blueprint('properties', __name__, url_prefix='/address-book')
 
-@properties_bp.teardown_request
-def teardown_property_db(exception=None):
-    teardown_db(exception)
-
 def get_property_controller():
-    """Create and return a PropertyController instance with request-level database session."""
-    db_session = get_db()
-    property_service = PropertyService(db_session)
-    job_service = JobService(db_session)
-    media_service = MediaService(db_session)
-    controller = PropertyController(
-        property_service=property_service,
-        job_service=job_service,
-        media_service=media_service
+    """Return the request's PropertyController, building it and its services on first use."""
+    return request_cached_controller('property_controller', _build_property_controller)
+
+def _build_property_controller(db_session):
+    return PropertyController(
+        property_service=PropertyService(db_session),
+        job_service=JobService(db_session),
+        media_service=MediaService(db_session)
     )
-    return controller
 
 @properties_bp.route('/', methods=['GET'])
 @login_required
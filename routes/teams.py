@@ -1,26 +1,21 @@
 from flask import Blueprint, request, render_template
 from flask_login import login_required
 from controllers.teams_controller import TeamController
-from database import teardown_db, get_db
+from utils.request_cache import request_cached_controller
 from services.team_service import TeamService
 from services.user_service import UserService
 
 teams_bp = Blueprint('teams', __name__, url_prefix='/teams')
 
-@teams_bp.teardown_request
-def teardown_team_db(exception=None):
-    teardown_db(exception)
-
 def get_team_controller():
-    """Create and return a TeamController instance with request-level database session."""
-    db_session = get_db()
-    team_service = TeamService(db_session)
-    user_service = UserService(db_session)
-    controller = TeamController(
-        team_service=team_service,
-        user_service=user_service
+    """Return the request's TeamController, building it and its services on first use."""
+    return request_cached_controller('team_controller', _build_team_controller)
+
+def _build_team_controller(db_session):
+    return TeamController(
+        team_service=TeamService(db_session),
+        user_service=UserService(db_session)
     )
-    return controller
 
 @teams_bp.route('/')
 @login_required
@@ -1,17 +1,13 @@
 # routes/users.py
 from flask import Blueprint, request, g
 from flask_login import login_required
-from database import get_db, teardown_db
+from database import get_db
 from services.user_service import UserService
 from utils.user_helper import UserHelper
 from controllers.users_controller import UserController
 
 user_bp = Blueprint('user', __name__, url_prefix='/users')
 
-@user_bp.teardown_request
-def teardown_user_db(exception=None):
-    teardown_db(exception)
-
 def get_user_controller():
     """Create and return a UserController instance with request-level database session."""
     db_session = get_db()
@@ -65,51 +65,50 @@ class AssignmentService:
         # Add the new team assignment for the job
     
         # Check if an assignment to the new team already exists to prevent duplicates
-        existing_assignment = self.db_session.query(Assignment).filter(
-            and_(
-                Assignment.job_id == job.id,
-                Assignment.team_id == new_team.id
-            )
-        ).first()
+        existing_assignment = self.db_session.query(
+            self.db_session.query(Assignment).filter(
+                and_(
+                    Assignment.job_id == job.id,
+                    Assignment.team_id == new_team.id
+                )
+            ).exists()
+        ).scalar()
         if not existing_assignment:
             self.create_assignment(job_id=job.id, team_id=new_team.id)
         else:
             return {"Job already assigned": f"Job {job.id} is already assigned to team {new_team.id}. No new assignment created."}
 
     def user_assigned_to_job(self, user_id, job_id):
-        assignment = self.db_session.query(Assignment).filter(
-            and_(
-                Assignment.job_id == job_id,
-                Assignment.user_id == user_id
-            )
-        ).first()
-        return assignment is not None
+        # EXISTS is answered from the (job_id, user_id) unique index without loading a row
+        return self.db_session.query(
+            self.db_session.query(Assignment).filter(
+                and_(
+                    Assignment.job_id == job_id,
+                    Assignment.user_id == user_id
+                )
+            ).exists()
+        ).scalar()
 
     def team_assigned_to_job(self, team_id, job_id):
-        assignment = self.db_session.query(Assignment).filter(
-            and_(
-                Assignment.job_id == job_id,
-                Assignment.team_id == team_id
-            )
-        ).first()
-        return assignment is not None    
+        # EXISTS is answered from the (job_id, team_id) unique index without loading a row
+        return self.db_session.query(
+            self.db_session.query(Assignment).filter(
+                and_(
+                    Assignment.job_id == job_id,
+                    Assignment.team_id == team_id
+                )
+            ).exists()
+        ).scalar()
 
     def get_users_for_job(self, job_id):
-        assignments = self.db_session.query(Assignment).filter(
-            and_(
-                Assignment.job_id == job_id,
-                Assignment.user_id != None
-            )
-        ).all()
-        cleaners = self.db_session.query(User).filter(User.id.in_([assignment.user_id for assignment in assignments])).all()
+        # Join through the assignments so the cleaners come back in one SELECT
+        cleaners = self.db_session.query(User).join(
+            Assignment, Assignment.user_id == User.id
+        ).filter(Assignment.job_id == job_id).all()
         return cleaners
 
     def get_teams_for_job(self, job_id):
-        assignments = self.db_session.query(Assignment).filter(
-            and_(
-                Assignment.job_id == job_id,
-                Assignment.team_id != None
-            )
-        ).all()
-        teams = self.db_session.query(Team).filter(Team.id.in_([assignment.team_id for assignment in assignments])).all()
+        teams = self.db_session.query(Team).join(
+            Assignment, Assignment.team_id == Team.id
+        ).filter(Assignment.job_id == job_id).all()
         return teams
@@ -5,12 +5,15 @@ from database import Job, Property, Team, User, Assignment
 from services.property_service import PropertyService
 from services.assignment_service import AssignmentService
 from sqlalchemy import DateTime, and_, cast, func
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, undefer_group
 from datetime import date, datetime, timedelta
 
 from tests.db_helpers import get_database_url
 from utils.timezone import from_app_tz, to_app_tz, utc_now, today_in_app_tz
 
+# Job cards only show the property address, so timetable queries skip the notes columns
+JOB_CARD_PROPERTY_LOADER = joinedload(Job.property).load_only(Property.address)
+
 def combine_date_time_sql(date_column, time_column):
     """
     Database-agnostic function to combine date and time columns in SQL.
@@ -41,6 +44,26 @@ def combine_date_time_sql(date_column, time_column):
     else:
         # Default fallback (SQLite syntax)
         return func.datetime(date_column, time_column)
+
+def job_date_bounds_sql(start_datetime_utc=None, end_datetime_utc=None):
+    """
+    Plain Job.date range conditions implied by a UTC start datetime range.
+    combine_date_time_sql wraps the columns in a function, so on its own it can't use
+    the (date, start_time) index; these bounds let the index narrow the rows first.
+    
+    Args:
+        start_datetime_utc: Inclusive UTC start of the range, or None for no lower bound
+        end_datetime_utc: Inclusive UTC end of the range, or None for no upper bound
+    
+    Returns:
+        tuple: SQLAlchemy conditions to combine with the exact datetime filter
+    """
+    bounds = ()
+    if start_datetime_utc is not None:
+        bounds += (Job.date >= start_datetime_utc.date(),)
+    if end_datetime_utc is not None:
+        bounds += (Job.date <= end_datetime_utc.date(),)
+    return bounds
     
     
 class JobService:
@@ -213,7 +236,8 @@ class JobService:
         return None
 
     def get_job_details(self, job_id, include_access_notes=False):
-        job = self.db_session.query(Job).options(joinedload(Job.property)).filter(Job.id == job_id).first()
+        # The details modal renders the report, so load the deferred sensitive columns with the row
+        job = self.db_session.query(Job).options(joinedload(Job.property), undefer_group('sensitive')).filter(Job.id == job_id).first()
         if job and not include_access_notes:
             job.property.access_notes = None
         return job
@@ -242,11 +266,11 @@ class JobService:
         # Filter by job start datetime (in UTC) falling within the date range
         if start_date:
             start_datetime_utc = from_app_tz(datetime.combine(start_date, datetime.min.time()))
-            query = query.filter(combine_date_time_sql(Job.date, Job.start_time) >= start_datetime_utc)
+            query = query.filter(*job_date_bounds_sql(start_datetime_utc=start_datetime_utc), combine_date_time_sql(Job.date, Job.start_time) >= start_datetime_utc)
         
         if end_date:
             end_datetime_utc = from_app_tz(datetime.combine(end_date, datetime.max.time()))
-            query = query.filter(combine_date_time_sql(Job.date, Job.start_time) <= end_datetime_utc)
+            query = query.filter(*job_date_bounds_sql(end_datetime_utc=end_datetime_utc), combine_date_time_sql(Job.date, Job.start_time) <= end_datetime_utc)
         
         if not show_completed:
             query = query.filter(Job.is_complete == False)
@@ -284,31 +308,28 @@ class JobService:
             and_(
                 # Create datetime from Job.date and Job.start_time (both in UTC)
                 # and check if it falls within the UTC datetime range
+                *job_date_bounds_sql(start_of_day_utc, end_of_day_utc),
                 combine_date_time_sql(Job.date, Job.start_time) >= start_of_day_utc,
                 combine_date_time_sql(Job.date, Job.start_time) <= end_of_day_utc,
                 (Assignment.user_id == user_id) | (Assignment.team_id == team_id)
             )
         ).distinct().subquery()
         
-        jobs = self.db_session.query(Job).options(joinedload(Job.property)).filter(
+        jobs = self.db_session.query(Job).options(JOB_CARD_PROPERTY_LOADER).filter(
             Job.id.in_(job_ids_subquery.select())
         ).order_by(Job.date, Job.start_time).all()
         
         return jobs
 
     def remove_team_from_jobs(self, team_id):
-        assignments = self.db_session.query(Assignment).filter_by(team_id=team_id).all()
-        for assignment in assignments:
-            self.db_session.delete(assignment)
+        # One bulk DELETE rather than loading and deleting each assignment
+        self.db_session.query(Assignment).filter(Assignment.team_id == team_id).delete()
         self.db_session.commit()
 
     def delete_job(self, job_id):
         job = self.db_session.query(Job).filter_by(id=job_id).first()
         if job:
-            assignments = self.assignment_service.get_assignments_for_job(job_id)
-            for assignment in assignments:
-                self.db_session.delete(assignment)
-            
+            self.db_session.query(Assignment).filter(Assignment.job_id == job_id).delete()
             self.db_session.delete(job)
             self.db_session.commit()
             return True
@@ -324,6 +345,7 @@ class JobService:
         # Find jobs where the job's start datetime (in UTC) is before today in app timezone
         uncompleted_jobs = self.db_session.query(Job).filter(
             and_(
+                *job_date_bounds_sql(end_datetime_utc=today_start_utc),
                 combine_date_time_sql(Job.date, Job.start_time) < today_start_utc,
                 Job.is_complete == False
             )
@@ -350,12 +372,13 @@ class JobService:
         end_of_day_utc = from_app_tz(end_of_day_app)
         
         # Query jobs with their team assignments for the specified date
-        jobs_with_teams = self.db_session.query(Job, Team).join(
+        jobs_with_teams = self.db_session.query(Job, Team).options(JOB_CARD_PROPERTY_LOADER).join(
             Assignment, Job.id == Assignment.job_id
         ).join(
             Team, Assignment.team_id == Team.id
         ).filter(
             and_(
+                *job_date_bounds_sql(start_of_day_utc, end_of_day_utc),
                 combine_date_time_sql(Job.date, Job.start_time) >= start_of_day_utc,
                 combine_date_time_sql(Job.date, Job.start_time) <= end_of_day_utc
             )
@@ -1,4 +1,5 @@
 from database import Media, PropertyMedia, JobMedia
+from sqlalchemy import insert
 import os
 from werkzeug.utils import secure_filename
 from typing import List, Dict, Any, Optional
@@ -202,13 +203,10 @@ class MediaService:
         Returns:
             list[Media]: List of Media objects
         """
-        associations = self.db_session.query(PropertyMedia).filter_by(
-            property_id=property_id
-        ).all()
-        media_ids = [assoc.media_id for assoc in associations]
-        if not media_ids:
-            return []
-        return self.db_session.query(Media).filter(Media.id.in_(media_ids)).all()
+        # Join through the link table so the gallery loads in one SELECT
+        return self.db_session.query(Media).join(
+            PropertyMedia, PropertyMedia.media_id == Media.id
+        ).filter(PropertyMedia.property_id == property_id).all()
 
     def get_media_for_job(self, job_id):
         """
@@ -220,13 +218,9 @@ class MediaService:
         Returns:
             list[Media]: List of Media objects
         """
-        associations = self.db_session.query(JobMedia).filter_by(
-            job_id=job_id
-        ).all()
-        media_ids = [assoc.media_id for assoc in associations]
-        if not media_ids:
-            return []
-        return self.db_session.query(Media).filter(Media.id.in_(media_ids)).all()
+        return self.db_session.query(Media).join(
+            JobMedia, JobMedia.media_id == Media.id
+        ).filter(JobMedia.job_id == job_id).all()
 
     def update_media_description(self, media_id, description):
         """
@@ -316,6 +310,90 @@ class MediaService:
 
     # ========== BATCH OPERATION METHODS ==========
 
+    def _associate_media_batch(self, link_model, owner_column, owner_id, media_ids):
+        """
+        Link media items to an owner with one lookup for existing links, one batched INSERT and one reload.
+
+        Args:
+            link_model: PropertyMedia or JobMedia
+            owner_column: The link model's owner foreign key column
+            owner_id (int): The property or job ID
+            media_ids (List[int]): List of media IDs to associate
+
+        Returns:
+            list: Association objects in the order of media_ids
+        """
+        if not media_ids:
+            return []
+        linked = {
+            media_id for (media_id,) in self.db_session.query(link_model.media_id).filter(
+                owner_column == owner_id,
+                link_model.media_id.in_(media_ids)
+            )
+        }
+        # dict.fromkeys drops repeated ids while keeping their order
+        new_links = [
+            {'media_id': media_id, owner_column.key: owner_id}
+            for media_id in dict.fromkeys(media_ids) if media_id not in linked
+        ]
+        if new_links:
+            # Core executemany sends one INSERT for the whole batch
+            self.db_session.execute(insert(link_model), new_links)
+            self.db_session.commit()
+
+        by_media_id = {
+            association.media_id: association
+            for association in self.db_session.query(link_model).filter(
+                owner_column == owner_id,
+                link_model.media_id.in_(media_ids)
+            )
+        }
+        return [by_media_id[media_id] for media_id in media_ids]
+
+    def _disassociate_media_batch(self, link_model, owner_column, owner_id, media_ids):
+        """
+        Unlink media items from an owner with one lookup and one batched DELETE.
+
+        Args:
+            link_model: PropertyMedia or JobMedia
+            owner_column: The link model's owner foreign key column
+            owner_id (int): The property or job ID
+            media_ids (List[int]): List of media IDs to disassociate
+
+        Returns:
+            Dict[str, Any]: Result with success/failure details
+        """
+        linked = set()
+        if media_ids:
+            linked = {
+                media_id for (media_id,) in self.db_session.query(link_model.media_id).filter(
+                    owner_column == owner_id,
+                    link_model.media_id.in_(media_ids)
+                )
+            }
+        successful = []
+        failed = []
+        for media_id in media_ids:
+            if media_id in linked:
+                linked.discard(media_id)
+                successful.append(media_id)
+            else:
+                failed.append({"id": media_id, "error": "Association not found"})
+
+        if successful:
+            self.db_session.query(link_model).filter(
+                owner_column == owner_id,
+                link_model.media_id.in_(successful)
+            ).delete()
+            self.db_session.commit()
+
+        return {
+            "success": len(failed) == 0,
+            "successful_items": successful,
+            "failed_items": failed,
+            "total_processed": len(media_ids)
+        }
+
     def associate_media_batch_with_property(self, property_id: int, media_ids: List[int]) -> List[PropertyMedia]:
         """
         Associate multiple media items with a property.
@@ -327,29 +405,7 @@ class MediaService:
         Returns:
             List[PropertyMedia]: List of created association objects
         """
-        associations = []
-        for media_id in media_ids:
-            # Check if association already exists
-            existing = self.db_session.query(PropertyMedia).filter_by(
-                media_id=media_id,
-                property_id=property_id
-            ).first()
-            if existing:
-                associations.append(existing)
-                continue
-
-            association = PropertyMedia(
-                media_id=media_id,
-                property_id=property_id
-            )
-            self.db_session.add(association)
-            associations.append(association)
-        
-        self.db_session.commit()
-        # Refresh all associations to get IDs
-        for assoc in associations:
-            self.db_session.refresh(assoc)
-        return associations
+        return self._associate_media_batch(PropertyMedia, PropertyMedia.property_id, property_id, media_ids)
 
     def associate_media_batch_with_job(self, job_id: int, media_ids: List[int]) -> List[JobMedia]:
         """
@@ -362,29 +418,7 @@ class MediaService:
         Returns:
             List[JobMedia]: List of created association objects
         """
-        associations = []
-        for media_id in media_ids:
-            # Check if association already exists
-            existing = self.db_session.query(JobMedia).filter_by(
-                media_id=media_id,
-                job_id=job_id
-            ).first()
-            if existing:
-                associations.append(existing)
-                continue
-
-            association = JobMedia(
-                media_id=media_id,
-                job_id=job_id
-            )
-            self.db_session.add(association)
-            associations.append(association)
-        
-        self.db_session.commit()
-        # Refresh all associations to get IDs
-        for assoc in associations:
-            self.db_session.refresh(assoc)
-        return associations
+        return self._associate_media_batch(JobMedia, JobMedia.job_id, job_id, media_ids)
 
     def disassociate_media_batch_from_property(self, property_id: int, media_ids: List[int]) -> Dict[str, Any]:
         """
@@ -397,29 +431,7 @@ class MediaService:
         Returns:
             Dict[str, Any]: Result with success/failure details
         """
-        successful = []
-        failed = []
-        
-        for media_id in media_ids:
-            association = self.db_session.query(PropertyMedia).filter_by(
-                media_id=media_id,
-                property_id=property_id
-            ).first()
-            
-            if association:
-                self.db_session.delete(association)
-                successful.append(media_id)
-            else:
-                failed.append({"id": media_id, "error": "Association not found"})
-        
-        self.db_session.commit()
-        
-        return {
-            "success": len(failed) == 0,
-            "successful_items": successful,
-            "failed_items": failed,
-            "total_processed": len(media_ids)
-        }
+        return self._disassociate_media_batch(PropertyMedia, PropertyMedia.property_id, property_id, media_ids)
 
     def disassociate_media_batch_from_job(self, job_id: int, media_ids: List[int]) -> Dict[str, Any]:
         """
@@ -432,29 +444,7 @@ class MediaService:
         Returns:
             Dict[str, Any]: Result with success/failure details
         """
-        successful = []
-        failed = []
-        
-        for media_id in media_ids:
-            association = self.db_session.query(JobMedia).filter_by(
-                media_id=media_id,
-                job_id=job_id
-            ).first()
-            
-            if association:
-                self.db_session.delete(association)
-                successful.append(media_id)
-            else:
-                failed.append({"id": media_id, "error": "Association not found"})
-        
-        self.db_session.commit()
-        
-        return {
-            "success": len(failed) == 0,
-            "successful_items": successful,
-            "failed_items": failed,
-            "total_processed": len(media_ids)
-        }
+        return self._disassociate_media_batch(JobMedia, JobMedia.job_id, job_id, media_ids)
 
     def upload_and_associate_with_property(self, property_id: int, files_data: List[dict]) -> List[Media]:
         """
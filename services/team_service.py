@@ -1,7 +1,10 @@
 from database import Team, User, Job, Assignment
 from services.job_service import JobService
 from services.user_service import UserService
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, selectinload
+
+# Loader options for every relationship Team.to_dict and the team templates read
+TEAM_WITH_MEMBERS_LOADER = (selectinload(Team.members), joinedload(Team.team_leader))
 
 class TeamService:
     def __init__(self, db_session):
@@ -10,13 +13,13 @@ class TeamService:
         self.user_service = UserService(self.db_session)
     def get_all_teams(self):
         teams = self.db_session.query(Team)\
-            .options(joinedload(Team.members), joinedload(Team.team_leader))\
+            .options(*TEAM_WITH_MEMBERS_LOADER)\
             .order_by(Team.id.asc())\
             .all()
         return teams
         
     def get_team(self, team_id):
-        team = self.db_session.query(Team).options(joinedload(Team.members)).filter(Team.id == team_id).first()
+        team = self.db_session.query(Team).options(*TEAM_WITH_MEMBERS_LOADER).filter(Team.id == team_id).first()
         return team
 
     def update_team(self, team):
@@ -1,5 +1,5 @@
 from werkzeug.security import check_password_hash
-from database import User
+from database import User, Assignment
 from sqlalchemy.orm import joinedload
 from utils.password_generator import generate_password_with_requirements
 
@@ -27,11 +27,12 @@ class UserService:
 
     def get_user_by_id(self, user_id):
         """Gets a user from the User table with the given id.
+        Uses the session identity map so repeat lookups within a request don't re-query.
         
         Returns:
             A User object or None
         """
-        user = self.db_session.query(User).filter_by(id=user_id).first()
+        user = self.db_session.get(User, user_id)
         return user
 
     def get_user_by_email(self, email):
@@ -80,10 +81,10 @@ class UserService:
         Returns:
             The Created User object or None if the email is not unique.
         """
-        existing_user = self.db_session.query(User).filter_by(email=email).first()
+        email_taken = self.db_session.query(self.db_session.query(User).filter_by(email=email).exists()).scalar()
 
         # Return none if the email is not unique
-        if existing_user:
+        if email_taken:
             return None
         
         new_user = User(first_name=first_name, last_name=last_name, email=email, phone=phone, role=role, team_id=team_id)
@@ -121,7 +122,7 @@ class UserService:
         Returns:
             The updated User object or None if the user is not found.
         """
-        user = self.db_session.query(User).filter_by(id=user_id).first()
+        user = self.get_user_by_id(user_id)
 
         # Return if the user is not in the table
         if not user:
@@ -152,10 +153,12 @@ class UserService:
         Returns:
             True if the user was successfully deleted, False otherwise.
         """
-        user = self.db_session.query(User).filter_by(id=user_id).first()
+        user = self.get_user_by_id(user_id)
         if not user:
             return False
         
+        # Detach the user's assignments in one UPDATE; User.assignments is never lazy loaded
+        self.db_session.query(Assignment).filter(Assignment.user_id == user.id).update({Assignment.user_id: None})
         self.db_session.delete(user)
         self.db_session.commit()
         return True
@@ -3,9 +3,10 @@ Database helper functions for E2E tests.
 Provides utilities to manipulate database state directly for testing time-based restrictions.
 """
 import os
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import sessionmaker, raiseload
 from database import Media
 
 def get_db_session():
@@ -129,4 +130,43 @@ def get_media_upload_date(media_id):
         media = session.query(Media).filter(Media.id == media_id).first()
         return media.upload_date if media else None
     finally:
-        session.close()
\ No newline at end of file
+        session.close()
+
+@contextmanager
+def count_queries(session):
+    """
+    Collect the SQL statements the session's engine executes inside the block.
+    Used to lock in N+1 free paths, e.g. assert len(statements) <= 2.
+
+    Args:
+        session: The SQLAlchemy session whose engine is observed
+
+    Yields:
+        list: The executed SQL statements, filled in as they run
+    """
+    statements = []
+    engine = session.get_bind()
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+
+def safe_query(session, model, *loads):
+    """
+    Select a model with only the given loader options allowed to load relationships.
+    Any other relationship access on the results raises instead of lazy loading.
+
+    Args:
+        session: The SQLAlchemy session
+        model: The mapped class to select
+        *loads: Loader options for the relationships the caller intends to use
+
+    Returns:
+        Result: The executed select, e.g. safe_query(...).scalars().all()
+    """
+    return session.execute(select(model).options(*loads, raiseload('*')))
@@ -16,6 +16,7 @@ from services.job_service import JobService
 from services.property_service import PropertyService
 from services.user_service import UserService
 from services.media_service import MediaService
+from services.team_service import TeamService
 from utils.populate_database import insert_dummy_data, populate_database
 from database import Team, get_db, teardown_db, User, Property, Job, Assignment, Media, PropertyMedia, JobMedia
 
@@ -458,6 +459,15 @@ def property_service(app):
         finally:
             session.close()
 
+@pytest.fixture
+def team_service(app):
+    with app.app_context():
+        session = app.config['SQLALCHEMY_SESSION']()
+        try:
+            yield TeamService(session)
+        finally:
+            session.close()
+
 @pytest.fixture
 def media_service(app):
     with app.app_context():
@@ -1,4 +1,5 @@
 # test_app.py
+import gzip
 import pytest
 
 def test_app_fixture(app):
@@ -17,4 +18,52 @@ def test_blueprints_registered(app):
     
     # Check specific important routes exist
     assert 'index' in routes, "Root route not registered"
-    assert 'user.login' in routes, "Login route not registered"
\ No newline at end of file
+    assert 'user.login' in routes, "Login route not registered"
+
+
+def test_nested_app_context_keeps_outer_session(app):
+    """Test that tearing down a nested app context leaves the outer context's session open"""
+    from database import get_db, User
+    with app.app_context():
+        outer = get_db()
+        user = outer.query(User).first()
+        with app.app_context():
+            assert get_db() is not outer
+        assert get_db() is outer
+        assert user in outer
+
+def test_init_db_accepts_dict_engine_options(tmp_path):
+    """Test that nested engine options such as connect_args don't break engine caching"""
+    from database import init_db
+    database_uri = f"sqlite:///{tmp_path / 'options.db'}"
+    Session = init_db(database_uri, {'connect_args': {'timeout': 15}})
+    with Session() as session:
+        assert session.connection().exec_driver_sql('SELECT 1').scalar() == 1
+
+    # Hashable options are still shared between calls
+    assert init_db(database_uri, {'pool_pre_ping': True}) is init_db(database_uri, {'pool_pre_ping': True})
+
+def test_json_responses_are_gzipped_when_accepted(app, admin_client):
+    """Test that JSON responses are gzipped only for clients that accept it, and HTML never is"""
+    from flask import jsonify
+    from utils.http import gzip_response
+    payload = [{'id': i, 'address': f'{i} Example Street'} for i in range(100)]
+
+    with app.test_request_context('/'):
+        plain = gzip_response(jsonify(payload))
+    assert 'Content-Encoding' not in plain.headers
+    assert 'Accept-Encoding' in plain.headers['Vary']
+
+    with app.test_request_context('/', headers={'Accept-Encoding': 'gzip'}):
+        compressed = gzip_response(jsonify(payload))
+    assert compressed.headers['Content-Encoding'] == 'gzip'
+    assert gzip.decompress(compressed.get_data()) == plain.get_data()
+
+    # HTML pages carry the CSRF token, so they are never compressed
+    page = admin_client.get('/jobs/', headers={'Accept-Encoding': 'gzip'})
+    assert page.status_code == 200
+    assert 'Content-Encoding' not in page.headers
+
+    # Tiny bodies are left alone
+    health = admin_client.get('/health', headers={'Accept-Encoding': 'gzip'})
+    assert 'Content-Encoding' not in health.headers
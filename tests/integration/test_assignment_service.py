@@ -3,6 +3,7 @@ import pytest
 from services.assignment_service import AssignmentService
 from database import Assignment, User, Job, Team, Property, get_db, teardown_db
 from datetime import date, time, datetime, timedelta
+from tests.db_helpers import count_queries
 
 today = date.today()
 tomorrow = date.today() + timedelta(days=1)
@@ -51,3 +52,15 @@ def test_team_assigned_to_job_not_assigned(assignment_service, seeded_test_data)
     job = seeded_test_data['jobs'][1]
     # Assert that the assignment service confirms the team is NOT assigned to the job
     assert assignment_service.team_assigned_to_job(seeded_test_data['teams']['Beta Team'].id, job.id) is False
+
+def test_users_and_teams_for_job_load_in_one_query_each(assignment_service, seeded_test_data):
+    """
+    Tests that get_users_for_job and get_teams_for_job each resolve the job's assignments with a single join.
+    The admin user (id=1) is assigned to job1 (id=1) and the 'Alpha Team' (id=1) to job4 (id=4) in the seeded data.
+    """
+    with count_queries(assignment_service.db_session) as statements:
+        users = assignment_service.get_users_for_job(seeded_test_data['jobs'][1].id)
+        teams = assignment_service.get_teams_for_job(seeded_test_data['jobs'][4].id)
+    assert seeded_test_data['users']['admin@example.com'].id in [user.id for user in users]
+    assert seeded_test_data['teams']['Alpha Team'].id in [team.id for team in teams]
+    assert len(statements) == 2
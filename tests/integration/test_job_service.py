@@ -1,8 +1,13 @@
+import pytest
 
 from datetime import datetime, timedelta, date, time
 import zoneinfo
 
 from config import DATETIME_FORMATS
+from database import Job, Assignment
+from sqlalchemy.orm import selectinload
+from sqlalchemy.exc import InvalidRequestError
+from tests.db_helpers import count_queries, safe_query
 from utils.timezone import from_app_tz, get_app_timezone, today_in_app_tz, to_app_tz, parse_to_utc
 
 
@@ -55,6 +60,30 @@ class TestJobServiceTimezoneHandling:
         assert updated_job_end_datetime == expected_end_datetime, "Updated job end datetime does not match the expected value in UTC."
         assert updated_job_arrival_datetime == expected_arrival_datetime, "Updated job arrival datetime does not match the expected value in UTC."
     
+    def test_job_duration_minutes_stored_on_write(self, job_service):
+        # Duration is stored when the job is created and recalculated when its times change
+        job_data = {
+            'date': '2024-07-01',
+            'start_time': '14:00',
+            'end_time': '16:30',
+            'property_id': 1,
+            'description': 'Test job duration'
+        }
+        new_job = job_service.create_job(job_data)
+        assert new_job.duration_minutes == 150, f"Expected 150 stored minutes but got {new_job.duration_minutes}"
+        assert new_job.duration == "2h 30m", f"Expected duration '2h 30m' but got '{new_job.duration}'"
+
+        job_data['end_time'] = '15:00'
+        updated_job = job_service.update_job(new_job.id, job_data)
+        assert updated_job.duration_minutes == 60, f"Expected 60 stored minutes but got {updated_job.duration_minutes}"
+        assert updated_job.duration == "1h", f"Expected duration '1h' but got '{updated_job.duration}'"
+
+    def test_job_duration_expression_orders_by_stored_minutes(self, job_service):
+        # The class-level duration expression projects duration_minutes, so SQL ordering is numeric
+        durations = [minutes for (minutes,) in job_service.db_session.query(Job.duration).order_by(Job.duration)]
+        assert durations, "Expected seeded jobs to have durations"
+        assert durations == sorted(durations), f"Expected durations in ascending minute order but got {durations}"
+
     def test_get_job_for_user_on_date_with_timezone(self, job_service):
         # Get jobs for a user on a specific date in the app's timezone
         user_id = 1  # Assuming a user with ID 1 exists
@@ -302,4 +331,165 @@ class TestJobServiceDSTEdgeCases:
         # Verify the range is 23 hours in UTC (due to DST)
         utc_range_hours = (next_midnight_utc - midnight_utc).total_seconds() / 3600
         assert utc_range_hours == 23.0, \
-            f"Expected 23-hour UTC range for DST day but got {utc_range_hours} hours"
\ No newline at end of file
+            f"Expected 23-hour UTC range for DST day but got {utc_range_hours} hours"
+
+
+class TestJobServiceDeletion:
+
+    def test_delete_job_removes_its_assignments(self, job_service):
+        # Job 1 has individual and team assignments in the seeded data
+        assert job_service.db_session.query(Assignment).filter_by(job_id=1).count() > 0
+        assert job_service.delete_job(1) is True
+        assert job_service.db_session.get(Job, 1) is None
+        assert job_service.db_session.query(Assignment).filter_by(job_id=1).count() == 0
+
+    def test_remove_team_from_jobs_deletes_team_assignments(self, job_service):
+        team_id = 2
+        assert job_service.db_session.query(Assignment).filter_by(team_id=team_id).count() > 0
+        job_service.remove_team_from_jobs(team_id)
+        assert job_service.db_session.query(Assignment).filter_by(team_id=team_id).count() == 0
+
+
+class TestJobServiceLoading:
+
+    def test_jobs_grouped_by_team_render_without_lazy_loads(self, job_service):
+        # Job cards read job.property, which the grouped query joins up front
+        jobs_by_team = job_service.get_jobs_grouped_by_team_for_date(today_in_app_tz())
+        assert jobs_by_team, "Expected seeded team jobs for today"
+
+        with count_queries(job_service.db_session) as statements:
+            addresses = [job.property.address for jobs in jobs_by_team.values() for job in jobs]
+
+        assert addresses
+        assert statements == [], f"Expected no lazy loads while reading job properties but got {statements}"
+
+    def test_timetable_jobs_load_only_the_property_address(self, job_service, admin_user):
+        # The job cards read property.address; the notes columns stay out of the SELECT
+        with count_queries(job_service.db_session) as statements:
+            jobs = job_service.get_jobs_for_user_on_date(admin_user.id, admin_user.team_id, today_in_app_tz())
+        assert jobs, "Expected seeded jobs for the admin today"
+        jobs_query = statements[-1]
+        assert "properties_1.address" in jobs_query
+        assert "access_notes" not in jobs_query and "properties_1.notes" not in jobs_query
+
+    def test_safe_query_raises_on_unplanned_lazy_load(self, job_service):
+        # Only the listed loads are allowed; touching any other relationship raises
+        jobs = safe_query(
+            job_service.db_session, Job,
+            selectinload(Job.assignments).selectinload(Assignment.user)
+        ).scalars().all()
+        assert jobs, "Expected seeded jobs"
+
+        with count_queries(job_service.db_session) as statements:
+            assigned_users = [assignment.user for job in jobs for assignment in job.assignments]
+        assert assigned_users
+        assert statements == []
+
+        with pytest.raises(InvalidRequestError):
+            jobs[0].property
+
+
+# users table as created before team_id was indexed
+LEGACY_USERS_TABLE = """
+CREATE TABLE users (
+    id INTEGER PRIMARY KEY,
+    first_name VARCHAR NOT NULL,
+    last_name VARCHAR NOT NULL,
+    email VARCHAR NOT NULL UNIQUE,
+    phone VARCHAR,
+    password_hash VARCHAR NOT NULL,
+    role VARCHAR NOT NULL,
+    team_id INTEGER
+)
+"""
+
+# assignments table as created before the reverse (user_id, job_id) and (team_id, job_id) indexes
+LEGACY_ASSIGNMENTS_TABLE = """
+CREATE TABLE assignments (
+    id INTEGER PRIMARY KEY,
+    job_id INTEGER NOT NULL,
+    user_id INTEGER,
+    team_id INTEGER,
+    CONSTRAINT _job_user_uc UNIQUE (job_id, user_id),
+    CONSTRAINT _job_team_uc UNIQUE (job_id, team_id)
+)
+"""
+
+# Media link tables as created before media_id was indexed
+LEGACY_MEDIA_LINK_TABLES = (
+    """
+    CREATE TABLE property_media (
+        id INTEGER PRIMARY KEY,
+        property_id INTEGER NOT NULL,
+        media_id INTEGER NOT NULL,
+        CONSTRAINT _property_media_uc UNIQUE (property_id, media_id)
+    )
+    """,
+    """
+    CREATE TABLE job_media (
+        id INTEGER PRIMARY KEY,
+        job_id INTEGER NOT NULL,
+        media_id INTEGER NOT NULL,
+        CONSTRAINT _job_media_uc UNIQUE (job_id, media_id)
+    )
+    """,
+)
+
+# jobs table as created before arrival_date and duration_minutes were added to the model
+LEGACY_JOBS_TABLE = """
+CREATE TABLE jobs (
+    id INTEGER PRIMARY KEY,
+    date DATE NOT NULL,
+    end_date DATE NOT NULL,
+    start_time TIME NOT NULL,
+    arrival_datetime DATETIME,
+    end_time TIME NOT NULL,
+    description VARCHAR,
+    is_complete BOOLEAN,
+    job_type VARCHAR,
+    report VARCHAR,
+    property_id INTEGER
+)
+"""
+
+
+class TestJobsTableUpgrade:
+
+    def test_init_db_adds_and_backfills_missing_job_columns(self, tmp_path):
+        import sqlite3
+        from sqlalchemy import inspect
+        from database import init_db
+
+        db_path = tmp_path / 'legacy.db'
+        connection = sqlite3.connect(db_path)
+        connection.execute(LEGACY_USERS_TABLE)
+        connection.execute(LEGACY_JOBS_TABLE)
+        connection.execute(LEGACY_ASSIGNMENTS_TABLE)
+        for statement in LEGACY_MEDIA_LINK_TABLES:
+            connection.execute(statement)
+        connection.execute(
+            "INSERT INTO jobs (id, date, end_date, start_time, arrival_datetime, end_time) "
+            "VALUES (1, '2024-07-01', '2024-07-01', '09:00:00.000000', '2024-07-01 08:45:00.000000', '11:30:00.000000')"
+        )
+        connection.commit()
+        connection.close()
+
+        Session = init_db(f'sqlite:///{db_path}')
+        with Session() as session:
+            job = session.get(Job, 1)
+            assert job.duration_minutes == 150
+            assert job.arrival_date == date(2024, 7, 1)
+            assert session.query(Job).filter(Job.arrival_date == date(2024, 7, 1)).count() == 1
+        inspector = inspect(Session.kw['bind'])
+        index_names = {index['name'] for index in inspector.get_indexes('jobs')}
+        assert {'ix_jobs_arrival_date', 'ix_jobs_property_date', 'ix_jobs_date_time'} <= index_names
+        assert 'ix_users_team_id' in {index['name'] for index in inspector.get_indexes('users')}
+        assignment_index_names = {index['name'] for index in inspector.get_indexes('assignments')}
+        assert {'ix_assignments_user_job', 'ix_assignments_team_job'} <= assignment_index_names
+        assert 'ix_property_media_media' in {index['name'] for index in inspector.get_indexes('property_media')}
+        assert 'ix_job_media_media' in {index['name'] for index in inspector.get_indexes('job_media')}
+
+        # A second run finds the columns present and changes nothing
+        Session = init_db(f'sqlite:///{db_path}')
+        with Session() as session:
+            assert session.get(Job, 1).duration_minutes == 150
@@ -158,4 +158,46 @@ def test_serve_file_route_local(client_local, local_storage_app):
             assert response.status_code == 404
             assert b"File serving not available when STORAGE_PROVIDER is 's3'" in response.data
         finally:
-            local_storage_app.config['STORAGE_PROVIDER'] = original_provider
\ No newline at end of file
+            local_storage_app.config['STORAGE_PROVIDER'] = original_provider
+
+
+def test_serve_file_route_local_caching(client_local, local_storage_app):
+    """Served media is cacheable and a matching ETag gets a 304 without the file body."""
+    upload_folder = local_storage_app.config['UPLOAD_FOLDER']
+    test_filename = "cached_file.txt"
+    with open(os.path.join(upload_folder, test_filename), 'wb') as f:
+        f.write(b"Cached content.")
+
+    response = client_local.get(f'/media/serve/{test_filename}')
+    assert response.status_code == 200
+    assert response.cache_control.max_age == 365 * 24 * 60 * 60
+    etag = response.headers['ETag']
+
+    response = client_local.get(f'/media/serve/{test_filename}', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.data == b""
+
+
+def test_serve_file_route_x_accel_redirect(client_local, local_storage_app):
+    """With MEDIA_X_ACCEL_PREFIX set, serving hands the file to nginx instead of sending the body."""
+    local_storage_app.config['MEDIA_X_ACCEL_PREFIX'] = '/_protected/'
+    try:
+        response = client_local.get('/media/serve/photo.jpg')
+        assert response.status_code == 200
+        assert response.headers['X-Accel-Redirect'] == '/_protected/photo.jpg'
+        assert response.headers['Content-Type'] == 'image/jpeg'
+        assert response.data == b""
+        assert response.cache_control.public
+        assert response.cache_control.max_age == 365 * 24 * 60 * 60
+
+        # Reserved characters in the filename are percent-encoded for nginx
+        response = client_local.get('/media/serve/my%20photo%3F%25.jpg')
+        assert response.headers['X-Accel-Redirect'] == '/_protected/my%20photo%3F%25.jpg'
+
+        # Paths that escape the upload folder are refused before nginx sees them
+        response = client_local.get('/media/serve/..%2Fsecret.txt')
+        assert response.status_code == 404
+        assert b"File not found" in response.data
+        assert 'X-Accel-Redirect' not in response.headers
+    finally:
+        local_storage_app.config.pop('MEDIA_X_ACCEL_PREFIX', None)
@@ -1,6 +1,7 @@
 import pytest
 from services.media_service import MediaService, MediaNotFound
 from database import Media, PropertyMedia, JobMedia, Property, Job
+from tests.db_helpers import count_queries
 
 
 def test_basic_media_crud(media_service):
@@ -289,3 +290,25 @@ def test_empty_batch_operations(media_service, seeded_test_data):
     # Empty upload and associate
     media_items = media_service.upload_and_associate_with_property(property_obj.id, [])
     assert media_items == []
+
+
+def test_batch_operations_do_not_query_per_item(media_service, seeded_test_data):
+    """Test that batch association and disassociation issue a fixed number of statements."""
+    property_obj = list(seeded_test_data['properties'].values())[0]
+    media_ids = [
+        media_service.add_media(f"bulk{i}.jpg", f"/uploads/bulk{i}.jpg", "image", "image/jpeg", 1024, f"Bulk {i}").id
+        for i in range(5)
+    ]
+
+    with count_queries(media_service.db_session) as statements:
+        associations = media_service.associate_media_batch_with_property(property_obj.id, media_ids)
+        ids = [association.id for association in associations]
+    assert all(ids)
+    # Existing-link lookup, batched INSERT, reload (plus transaction bookkeeping)
+    assert len(statements) <= 4, statements
+
+    with count_queries(media_service.db_session) as statements:
+        result = media_service.disassociate_media_batch_from_property(property_obj.id, media_ids + [9999])
+    assert result["successful_items"] == media_ids
+    assert result["failed_items"] == [{"id": 9999, "error": "Association not found"}]
+    assert len(statements) <= 3, statements
@@ -89,4 +89,25 @@ def test_get_placeholder_media_url_video(app):
     with app.app_context():
         # Assuming placeholder exists for video
         url = resolve_media_url(None, MEDIA_TYPE_IMAGE)
-        assert url == '/static/images/placeholders/image-not-found.png'
\ No newline at end of file
+        assert url == '/static/images/placeholders/image-not-found.png'
+
+
+def test_extract_metadata_reads_uploads_in_place(app):
+    """Test that image metadata is read from an upload stream without a temp file and the stream is rewound."""
+    import io
+    from PIL import Image
+    from werkzeug.datastructures import FileStorage
+    from utils.media_utils import extract_metadata
+
+    buffer = io.BytesIO()
+    Image.new('RGB', (12, 7)).save(buffer, format='PNG')
+    buffer.seek(0)
+    upload = FileStorage(stream=buffer, filename='upload.png', content_type='image/png')
+
+    with app.app_context(), patch('utils.media_utils.tempfile.NamedTemporaryFile') as mock_tempfile:
+        metadata = extract_metadata(upload, MEDIA_TYPE_IMAGE)
+
+    assert (metadata['width'], metadata['height']) == (12, 7)
+    assert metadata['format'] == 'PNG'
+    mock_tempfile.assert_not_called()
+    assert buffer.tell() == 0
@@ -0,0 +1,30 @@
+from tests.db_helpers import count_queries
+
+
+def test_get_all_teams_serialises_without_lazy_loads(team_service):
+    """
+    Tests that the relationships Team.to_dict reads are eager loaded by get_all_teams,
+    so serialising every team issues no further SQL.
+    """
+    teams = team_service.get_all_teams()
+    assert teams, "Expected seeded teams"
+
+    with count_queries(team_service.db_session) as statements:
+        serialised = [team.to_dict() for team in teams]
+
+    assert statements == [], f"Expected no lazy loads while serialising teams but got {statements}"
+    assert any(team['members'] for team in serialised)
+
+
+def test_get_team_serialises_without_lazy_loads(team_service, seeded_test_data):
+    """
+    Tests that get_team eager loads the team leader and members used by Team.to_dict.
+    """
+    team_id = seeded_test_data['teams']['Alpha Team'].id
+    team = team_service.get_team(team_id)
+
+    with count_queries(team_service.db_session) as statements:
+        team_data = team.to_dict()
+
+    assert statements == [], f"Expected no lazy loads while serialising the team but got {statements}"
+    assert team_data['team_leader'] is not None
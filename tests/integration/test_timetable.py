@@ -4,7 +4,7 @@ from datetime import datetime, date, time, timedelta
 
 from config import DATETIME_FORMATS
 from database import Job, Assignment, Team
-from tests.db_helpers import get_db_session
+from tests.db_helpers import get_db_session, count_queries
 from utils.test_data import get_job_data_by_id
 from utils.timezone import today_in_app_tz, get_app_timezone, from_app_tz
 
@@ -80,6 +80,14 @@ def check_jobs_by_team(expected_jobs_by_team: dict, soup: BeautifulSoup, expecte
             assert job_property_address == expected_jobs[job_id].property.address, \
                 f"Expected job property address for job {job_id} to be {expected_jobs[job_id].property.address} but got {job_property_address}"                              
 
+def test_timetable_query_count(admin_client_no_csrf, job_service):
+    """Tests that rendering the timetable runs a fixed handful of queries, not one per job or team."""
+    with count_queries(job_service.db_session) as statements:
+        response = admin_client_no_csrf.get("/jobs/")
+    assert response.status_code == 200
+    # Loading the user, pushing stale jobs, the user check, the user's jobs, and all teams with their members
+    assert len(statements) <= 6, f"Expected at most 6 queries but got {len(statements)}: {statements}"
+
 @pytest.mark.parametrize("client_fixture", ["admin_client_no_csrf", "supervisor_client_no_csrf", "regular_client_no_csrf"])
 def test_timetable_job_data(request, client_fixture):
     """Tests that the job data rendered on the timetable views matches the test data."""
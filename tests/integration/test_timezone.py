@@ -221,6 +221,38 @@ def test_app_now_uses_utc_now() -> None:
     assert time_diff < 0.1
 
 
+def test_compile_strftime_matches_strftime() -> None:
+    """Test that compiled formatters produce the same output as strftime."""
+    from utils.timezone import compile_strftime
+    from config import DATETIME_FORMATS
+    
+    dt = datetime(2024, 3, 7, 9, 5, 4)
+    for format_str in DATETIME_FORMATS.values():
+        assert compile_strftime(format_str)(dt) == dt.strftime(format_str)
+    
+    # Literal braces and escaped percent signs pass through unchanged
+    assert compile_strftime("{%H%%}")(dt) == dt.strftime("{%H%%}")
+    # Times format too, as long as the format only reads time fields
+    assert compile_strftime("%H:%M")(dt.time()) == "09:05"
+
+
+def test_job_display_times_under_utc(monkeypatch) -> None:
+    """Test that the UTC fast path for job times matches the full conversion."""
+    from datetime import date, time
+    from database import Job
+    from utils.timezone import app_tz_is_utc
+    
+    job = Job(date=date(2024, 1, 1), start_time=time(23, 30), end_time=time(1, 15))
+    assert not app_tz_is_utc()
+    # Australia/Melbourne is UTC+11 on Jan 1
+    assert job.display_time == "10:30"
+    
+    monkeypatch.setenv('APP_TIMEZONE', 'UTC')
+    assert app_tz_is_utc()
+    assert job.display_time == "23:30"
+    assert job.display_start_time == "23:30"
+    assert job.display_end_time == "01:15"
+
 class TestTimezoneDSTEdgeCases:
     """Test class specifically for daylight savings time edge cases."""
     
@@ -0,0 +1,28 @@
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+
+from database import Assignment
+
+
+def test_user_assignments_are_not_lazy_loaded(user_service, seeded_test_data):
+    """
+    Tests that reading User.assignments without an explicit loader option raises
+    instead of silently loading the user's whole assignment history.
+    """
+    user = user_service.get_user_by_id(seeded_test_data['users']['admin@example.com'].id)
+    with pytest.raises(InvalidRequestError):
+        user.assignments
+
+
+def test_delete_user_detaches_assignments(user_service, seeded_test_data):
+    """
+    Tests that deleting a user with assignments succeeds and clears the user from those assignments.
+    The admin user (id=1) is assigned to job1 (id=1) in the seeded data.
+    """
+    user_id = seeded_test_data['users']['admin@example.com'].id
+    assert user_service.db_session.query(Assignment).filter_by(user_id=user_id).count() > 0
+
+    assert user_service.delete_user(user_id) is True
+
+    assert user_service.get_user_by_id(user_id) is None
+    assert user_service.db_session.query(Assignment).filter_by(user_id=user_id).count() == 0
@@ -1,4 +1,6 @@
+import gzip
 import unicodedata
+from flask import request
 from urllib.parse import (ParseResult, SplitResult, _splitparams, uses_params, _coerce_args, _splitnetloc, scheme_chars, urlparse)
 
 def validate_request_host(url, host_url, development_mode: bool):
@@ -11,6 +13,30 @@ def validate_request_host(url, host_url, development_mode: bool):
         _return = url_has_allowed_host_and_scheme(url, host_url)
     return _return
 
+# Responses below this size are not worth the gzip header and CPU
+GZIP_MIN_SIZE = 1024
+# JSON only: HTML pages embed the CSRF token next to reflected input, and compressing
+# them would expose the token to BREACH-style length probing
+GZIP_MIMETYPES = {'application/json'}
+
+def gzip_response(response):
+    """
+    Gzip JSON responses for clients that accept it. Registered as an after_request hook.
+    Streamed or file responses, small bodies, errors and HTML pass through unchanged.
+    """
+    if (response.status_code != 200 or response.direct_passthrough or response.is_streamed
+            or response.mimetype not in GZIP_MIMETYPES or 'Content-Encoding' in response.headers):
+        return response
+    response.vary.add('Accept-Encoding')
+    if not request.accept_encodings['gzip']:
+        return response
+    body = response.get_data()
+    if len(body) < GZIP_MIN_SIZE:
+        return response
+    response.set_data(gzip.compress(body, compresslevel=6))
+    response.headers['Content-Encoding'] = 'gzip'
+    return response
+
 # Copied from Django.utils
 def url_has_allowed_host_and_scheme(url, allowed_hosts, require_https=False):
     """
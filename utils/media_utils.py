@@ -32,6 +32,9 @@ MEDIA_TYPE_VIDEO = 'video'
 MEDIA_TYPE_DOCUMENT = 'document'
 MEDIA_TYPE_AUDIO = 'audio'
 
+# Chunk size used when an upload has to be copied to a temporary file
+UPLOAD_COPY_CHUNK_SIZE = 64 * 1024
+
 # Supported MIME types for each media type
 SUPPORTED_MIME_TYPES = {
     MEDIA_TYPE_IMAGE: {'image/jpeg', 'image/png', 'image/gif', 'image/webp'},
@@ -209,22 +212,27 @@ def generate_thumbnail(file_path: str, media_type: str, output_path: str, size:
         raise NotImplementedError(f'Thumbnail generation not implemented for {media_type}')
 
 
-def extract_metadata(file_path: str, media_type: str) -> Dict[str, Any]:
+def extract_metadata(file_path, media_type: str) -> Dict[str, Any]:
     """
     Extract metadata from media file.
     
     Args:
-        file_path: Path to the media file
+        file_path: Path to the media file, or an uploaded file object (e.g. werkzeug.FileStorage)
         media_type: One of MEDIA_TYPE_* constants
         
     Returns:
         Dict[str, Any]: Metadata dictionary with keys specific to media type
     """
+    if media_type == MEDIA_TYPE_VIDEO and not isinstance(file_path, (str, os.PathLike)):
+        return _extract_upload_video_metadata(file_path)
+
     metadata = {}
     
     if media_type == MEDIA_TYPE_IMAGE:
+        # Uploads are read from their stream directly; Pillow only needs the header
+        source = getattr(file_path, 'stream', file_path)
         try:
-            with Image.open(file_path) as img:
+            with Image.open(source) as img:
                 metadata['width'], metadata['height'] = img.size
                 metadata['format'] = img.format
                 metadata['mode'] = img.mode
@@ -233,6 +241,9 @@ def extract_metadata(file_path: str, media_type: str) -> Dict[str, Any]:
                     metadata['exif'] = dict(img._getexif())
         except Exception as e:
             current_app.logger.warning(f'Failed to extract image metadata: {e}')
+        finally:
+            if hasattr(source, 'seek'):
+                source.seek(0)
     
     elif media_type == MEDIA_TYPE_VIDEO:
         # Use ffprobe to extract video metadata
@@ -263,6 +274,28 @@ def extract_metadata(file_path: str, media_type: str) -> Dict[str, Any]:
     return metadata
 
 
+
+def _extract_upload_video_metadata(upload) -> Dict[str, Any]:
+    """
+    Copy an uploaded video to a temporary file so ffprobe can read it, then extract its metadata.
+    
+    Args:
+        upload: werkzeug.FileStorage or other seekable binary file object
+        
+    Returns:
+        Dict[str, Any]: Video metadata dictionary
+    """
+    stream = getattr(upload, 'stream', upload)
+    suffix = os.path.splitext(getattr(upload, 'filename', None) or '')[1]
+    stream.seek(0)
+    try:
+        with tempfile.NamedTemporaryFile(suffix=suffix) as tmp:
+            shutil.copyfileobj(stream, tmp, UPLOAD_COPY_CHUNK_SIZE)
+            tmp.flush()
+            return extract_metadata(tmp.name, MEDIA_TYPE_VIDEO)
+    finally:
+        stream.seek(0)
+
 def transcode_video(input_path: str, output_path: str, format: str = 'mp4') -> str:
     """
     Convert videos to different formats.
@@ -1,7 +1,10 @@
 import os
+from functools import lru_cache
 from zoneinfo import ZoneInfo
+from werkzeug.security import generate_password_hash
+from sqlalchemy import bindparam, update
 from config import Config
-from database import User, init_db
+from database import User, init_db, calculate_duration_minutes
 from database import Team, Property, Job, Assignment, Media, PropertyMedia, JobMedia
 from datetime import date, datetime, time, timedelta
 
@@ -25,112 +28,114 @@ def populate_database(database_uri=None, force=True, Session=None):
                 os.makedirs(database_dir)
 
         Session = init_db(database_uri)
-        if not force and Session().query(User).filter_by(role='admin').first():
-            print("Database already populated. Exiting.")
+        if not force:
+            with Session() as session:
+                if session.query(session.query(User).filter_by(role='admin').exists()).scalar():
+                    print("Database already populated. Exiting.")
         return
     insert_dummy_data(Session)
     print("Database populated with dummy data.")
 
-def create_initial_users(session):
+# The seed credentials are public fixtures in utils/test_data and only seeded in debug/testing,
+# so a single pbkdf2 iteration is enough; production passwords keep PASSWORD_HASH_METHOD
+SEED_PASSWORD_HASH_METHOD = 'pbkdf2:sha256:1'
+
+@lru_cache(maxsize=None)
+def _seed_password_hash(password):
     """
-    Creates a set of deterministic initial users (admin, supervisor, user)
-    and clears any existing users to ensure a clean state.
+    Returns a password hash for a seed user, hashing each distinct password only once per process.
+    The database is reseeded after every test, so this avoids repeating even the cheap seed hashing.
 
     Args:
-        session: The SQLAlchemy session.
+        password (str): The plain text seed password.
 
     Returns:
-        tuple: A tuple containing the created admin, supervisor, and user User objects.
+        str: The werkzeug password hash.
     """
-    session.query(User).delete()
-    session.commit()
-    users = {}
-    for user_key, user_data in USER_DATA.items():
-        user = User(id=user_data['id'], first_name=user_data['first_name'], last_name=user_data['last_name'],
-                    email=user_data['email'], phone=user_data.get('phone'), role=user_data['role'])
-        user.set_password(user_data['password'])
-        session.add(user)
-        users[user_key] = user
-    session.commit()
-    return users['admin'], users['supervisor'], users['user'], users['team_leader']
+    return generate_password_hash(password, method=SEED_PASSWORD_HASH_METHOD)
 
-def _create_team(session, team_name, team_leader_id=None, members=None, team_id=None):
+def create_initial_users(session):
     """
-    Helper function to create or update a team with deterministic data.
+    Creates a set of deterministic initial users (admin, supervisor, user, team leader).
+    Expects the users table to have been cleared by delete_teams_users.
 
     Args:
         session: The SQLAlchemy session.
-        team_name (str): The name of the team.
-        team_leader_id (int): The ID of the team leader.
-        members (list, optional): A list of User objects to assign to the team. Defaults to None.
-        team_id (int, optional): The explicit ID for the team. If None, SQLAlchemy assigns one.
 
     Returns:
-        Team: The created or updated Team object.
+        tuple: A tuple containing the inserted admin, supervisor, user and team leader rows.
     """
-    team = session.query(Team).filter_by(name=team_name).first()
-    if team:
-        team.team_leader_id = team_leader_id
-    else:
-        team = Team(id=team_id, name=team_name, team_leader_id=team_leader_id)
-        session.add(team)
-    session.commit()
-
-    if members:
-        for member in members:
-            member.team_id = team.id
-        session.commit()
-    return team
+    users = {}
+    for user_key, user_data in USER_DATA.items():
+        users[user_key] = {
+            'id': user_data['id'],
+            'first_name': user_data['first_name'],
+            'last_name': user_data['last_name'],
+            'email': user_data['email'],
+            'phone': user_data.get('phone'),
+            'role': user_data['role'],
+            'password_hash': _seed_password_hash(user_data['password']),
+            'team_id': None
+        }
+    # Core executemany inserts skip the ORM unit of work, which dominates seeding cost
+    session.execute(User.__table__.insert(), list(users.values()))
+    return users['admin'], users['supervisor'], users['user'], users['team_leader']
 
 def create_initial_teams(session, admin, supervisor_user, user_user, team_leader):
     """
-    Creates a set of deterministic initial teams and clears any existing teams
-    to ensure a clean state.
+    Creates a set of deterministic initial teams and assigns their members.
+    Expects the teams table to have been cleared by delete_teams_users.
 
     Args:
         session: The SQLAlchemy session.
-        admin (User): The admin User object.
-        supervisor_user (User): The supervisor User object.
-        user (User): The user User object.
-        team_leader (User): The team leader User object.
+        admin (dict): The admin user row.
+        supervisor_user (dict): The supervisor user row.
+        user (dict): The user user row.
+        team_leader (dict): The team leader user row.
     Returns:
-        tuple: A tuple containing the created initial_team, alpha_team, beta_team,
-               charlie_team, and delta_team objects.
+        tuple: A tuple containing the inserted initial_team, alpha_team, beta_team,
+               charlie_team, and delta_team rows.
     """
-    session.query(Team).delete()
-    session.commit()
+    # The user rows were inserted with their explicit USER_DATA ids, so no lookup query is needed
     teams = {}
+    memberships = []
     for team_key, team_data in TEAM_DATA.items():
-        members = []
         for username in team_data.get('members', []):
-            user = session.query(User).filter_by(email=USER_DATA[username]['email']).first()
-            if user is None:
-                raise ValueError(f"User with email {USER_DATA[username]['email']} not found in database. Please make sure the user table is initialized first.")
-            members.append(user)
+            user_id = USER_DATA[username]['id']
+            memberships.append({'member_id': user_id, 'member_team_id': team_data['id']})
             if team_data['team_leader_key'] == username:
-                team_leader_id = user.id
-        teams[team_key] = _create_team(session, team_id=team_data['id'], team_name=team_data['name'], team_leader_id=team_leader_id, members=members)
+                team_leader_id = user_id
+        teams[team_key] = {'id': team_data['id'], 'name': team_data['name'], 'team_leader_id': team_leader_id}
+
+    session.execute(Team.__table__.insert(), list(teams.values()))
+    if memberships:
+        # One executemany UPDATE assigns every member to their team
+        users_table = User.__table__
+        session.execute(
+            update(users_table).where(users_table.c.id == bindparam('member_id')).values(team_id=bindparam('member_team_id')),
+            memberships
+        )
     return teams['initial_team'], teams['alpha_team'], teams['beta_team'], teams['charlie_team'], teams['delta_team']
 
-def _create_job(session, date, start_time, end_time, description, property_obj, team_obj=None, user_obj=None, job_id=None, arrival_date_offset=0, complete=False):
+def _build_job_rows(date, start_time, end_time, description, property_id, team_id=None, user_id=None, job_id=None, arrival_date_offset=0, complete=False):
     """
-    Helper function to create a job with deterministic data.
+    Helper function to build the table rows for a job and its assignments with deterministic data.
+    The rows are plain dicts so they can be inserted in bulk through SQLAlchemy Core.
 
     Args:
-        session: The SQLAlchemy session.
         date (date): The date of the job.
         start_time (time): The start time of the job.
         end_time (time): The end time of the job.
         description (str): The description of the job.
-        property_obj (Property): The Property object associated with the job.
-        team_obj (Team, optional): The Team object assigned to the job. Defaults to None.
-        user_obj (User, optional): The User object assigned to the job. Defaults to None.
-        job_id (int, optional): The explicit ID for the job. If None, SQLAlchemy assigns one.
+        property_id (int): The ID of the property associated with the job.
+        team_id (int, optional): The ID of the team assigned to the job. Defaults to None.
+        user_id (int, optional): The ID of the user assigned to the job. Defaults to None.
+        job_id (int): The explicit ID for the job, required so assignments can reference it before insert.
         arrival_date_offset (int): The number of days to offset the arrival date from the job date.
         complete (bool): Whether the job is marked as complete. Defaults to False.
 
     Returns:
-        Job: The created Job object.
+        tuple: A tuple containing the job row dict and a list of assignment row dicts.
     """
     app_tz = get_app_timezone()
 
@@ -147,94 +152,95 @@ def _create_job(session, date, start_time, end_time, description, property_obj,
 
     arrival_date_for_job = start_dt.date() + timedelta(days=arrival_date_offset)
     
-    job = Job(
-        id=job_id,
-        date=start_dt.date(),
-        end_date=end_dt.date(),  # Use end date from end_dt
-        start_time=start_dt.time(),
-        arrival_datetime=datetime.combine(arrival_date_for_job, start_dt.time()),
-        end_time=end_dt.time(),
-        description=description,
-        is_complete=complete,
-        property=property_obj
-    )
-    session.add(job)
-    session.commit()
-
-    if user_obj:
-        assignment = Assignment(job_id=job.id, user_id=user_obj.id)
-        session.add(assignment)
-        session.commit()
+    job_row = {
+        'id': job_id,
+        'date': start_dt.date(),
+        'end_date': end_dt.date(),  # Use end date from end_dt
+        'start_time': start_dt.time(),
+        'arrival_datetime': datetime.combine(arrival_date_for_job, start_dt.time()),
+        'end_time': end_dt.time(),
+        # Core inserts skip the ORM listener that maintains this column
+        'duration_minutes': calculate_duration_minutes(start_dt.date(), start_dt.time(), end_dt.date(), end_dt.time()),
+        'description': description,
+        'is_complete': complete,
+        'job_type': None,
+        'property_id': property_id,
+    }
+
+    assignment_rows = []
+    if user_id:
+        assignment_rows.append({'job_id': job_id, 'user_id': user_id, 'team_id': None})
     
-    if team_obj:
-        assignment = Assignment(job_id=job.id, team_id=team_obj.id)
-        session.add(assignment)
-        session.commit()
-    return job
+    if team_id:
+        assignment_rows.append({'job_id': job_id, 'user_id': None, 'team_id': team_id})
+    return job_row, assignment_rows
 
 def create_initial_properties(session):
     """
-    Creates a set of deterministic initial properties and clears any existing
-    properties to ensure a clean state.
+    Creates a set of deterministic initial properties.
+    Expects the properties table to have been cleared by delete_jobs_assignments_properties.
 
     Args:
         session: The SQLAlchemy session.
 
     Returns:
-        tuple: A tuple containing the created anytown_property and teamville_property objects.
+        tuple: A tuple containing the inserted anytown_property and teamville_property rows.
     """
-    session.query(Property).delete()
-    session.commit()
     properties = {}
     for property_key, property_data in PROPERTY_DATA.items():
-        property_obj = Property(id=property_data['id'], address=property_data['address'], access_notes=property_data['access_notes'])
-        session.add(property_obj)
-        properties[property_key] = property_obj
-    session.commit()
+        properties[property_key] = {'id': property_data['id'], 'address': property_data['address'], 'access_notes': property_data['access_notes'], 'notes': None}
+    session.execute(Property.__table__.insert(), list(properties.values()))
     return properties['anytown_property'], properties['teamville_property']
 
 def create_initial_jobs(session, anytown_property, teamville_property, admin, user, initial_team, alpha_team, beta_team, charlie_team, delta_team):
     """
-    Creates a set of deterministic initial jobs and clears any existing
-    jobs and assignments to ensure a clean state.
+    Creates a set of deterministic initial jobs and their assignments.
+    Expects the jobs and assignments tables to have been cleared by delete_jobs_assignments_properties.
 
     Args:
         session: The SQLAlchemy session.
-        anytown_property (Property): The '123 Main St, Anytown' Property object.
-        teamville_property (Property): The '456 Oak Ave, Teamville' Property object.
-        admin (User): The admin User object.
-        user (User): The user User object.
-        initial_team (Team): The 'Initial Team' object.
-        alpha_team (Team): The 'Alpha Team' object.
-        beta_team (Team): The 'Beta Team' object.
-        charlie_team (Team): The 'Charlie Team' object.
-        delta_team (Team): The 'Delta Team' object.
-    """
-    session.query(Assignment).delete()
-    session.query(Job).delete()
-    session.commit()
+        anytown_property (dict): The '123 Main St, Anytown' property row.
+        teamville_property (dict): The '456 Oak Ave, Teamville' property row.
+        admin (dict): The admin user row.
+        user (dict): The user user row.
+        initial_team (dict): The 'Initial Team' row.
+        alpha_team (dict): The 'Alpha Team' row.
+        beta_team (dict): The 'Beta Team' row.
+        charlie_team (dict): The 'Charlie Team' row.
+        delta_team (dict): The 'Delta Team' row.
 
-    today = today_in_app_tz()
+    Returns:
+        dict: The inserted job rows keyed by job ID.
+    """
+    # Resolve today once so every seeded job shares the same reference date, even across midnight
+    reference_date = today_in_app_tz()
     jobs = {}
+    assignment_rows = []
     for template in JOB_TEMPLATES:
-        job_data = get_job_data_by_id(template['id'])
-        team = session.query(Team).filter_by(name=TEAM_DATA[template['team_key']]['name']).first() if template['team_key'] else None
-        user = session.query(User).filter_by(email=USER_DATA[template['user_key']]['email']).first() if template['user_key'] else None
-        property_obj = anytown_property if template['property_key'] == 'anytown_property' else teamville_property
-        job = _create_job(
-            session=session,
+        job_data = get_job_data_by_id(template['id'], reference_date=reference_date)
+        # Teams and users were seeded with their explicit TEAM_DATA/USER_DATA ids
+        team_id = TEAM_DATA[template['team_key']]['id'] if template['team_key'] else None
+        user_id = USER_DATA[template['user_key']]['id'] if template['user_key'] else None
+        property_row = anytown_property if template['property_key'] == 'anytown_property' else teamville_property
+        job_row, job_assignment_rows = _build_job_rows(
             date=job_data['date'],
             start_time=job_data['start_time'],
             end_time=job_data['end_time'],
             description=template['description'],
-            property_obj=property_obj,
-            team_obj=team,
-            user_obj=user,
+            property_id=property_row['id'],
+            team_id=team_id,
+            user_id=user_id,
             job_id=template['id'],
             arrival_date_offset=template.get('arrival_date_offset', 0),
             complete=template.get('complete', False)
         )
-        jobs[template['id']] = job
+        jobs[template['id']] = job_row
+        assignment_rows.extend(job_assignment_rows)
+
+    # Core executemany inserts skip the ORM unit of work, which dominates seeding cost
+    session.execute(Job.__table__.insert(), list(jobs.values()))
+    if assignment_rows:
+        session.execute(Assignment.__table__.insert(), assignment_rows)
     return jobs
 
 def _fix_postgres_sequences(session):
@@ -271,23 +277,23 @@ def _fix_postgres_sequences(session):
     
     for table_name, id_column in tables:
         try:
-            # Get the maximum ID in the table
-            max_id_result = session.execute(
-                text(f'SELECT COALESCE(MAX({id_column}), 0) FROM {table_name}')
-            ).scalar()
-            max_id = max_id_result or 0
-            
-            if max_id > 0:
-                # Fix the sequence
-                sequence_name = f'{table_name}_{id_column}_seq'
-                session.execute(
-                    text(f"SELECT setval('{sequence_name}', :max_id, true)"),
-                    {'max_id': max_id}
-                )
+            # Each fix runs in a savepoint so a failure doesn't abort the surrounding seed transaction
+            with session.begin_nested():
+                # Get the maximum ID in the table
+                max_id_result = session.execute(
+                    text(f'SELECT COALESCE(MAX({id_column}), 0) FROM {table_name}')
+                ).scalar()
+                max_id = max_id_result or 0
+                
+                if max_id > 0:
+                    # Fix the sequence
+                    sequence_name = f'{table_name}_{id_column}_seq'
+                    session.execute(
+                        text(f"SELECT setval('{sequence_name}', :max_id, true)"),
+                        {'max_id': max_id}
+                    )
         except Exception as e:
             print(f"  Warning: Could not fix sequence for {table_name}.{id_column}: {e}")
-    
-    session.commit()
 
 def delete_jobs_assignments_properties(session):
     """
@@ -299,17 +305,16 @@ def delete_jobs_assignments_properties(session):
     """
     # Delete all data in correct order to avoid foreign key constraint violations
     # 1. Delete assignments first (references users, jobs, teams)
-    session.query(Assignment).delete()
+    session.execute(Assignment.__table__.delete())
     # 2. Delete job_media and property_media (references media, jobs, properties)
-    session.query(JobMedia).delete()
-    session.query(PropertyMedia).delete()
+    session.execute(JobMedia.__table__.delete())
+    session.execute(PropertyMedia.__table__.delete())
     # 3. Delete media (referenced by job_media and property_media)
-    session.query(Media).delete()
+    session.execute(Media.__table__.delete())
     # 4. Delete jobs (references properties)
-    session.query(Job).delete()
+    session.execute(Job.__table__.delete())
     # 5. Delete properties
-    session.query(Property).delete()
-    session.commit()
+    session.execute(Property.__table__.delete())
 
 def delete_teams_users(session):
     """
@@ -322,22 +327,22 @@ def delete_teams_users(session):
     #    - users.team_id references teams.id
     #    - teams.team_leader_id references users.id
     # So we need to set team_id to NULL for all users first
-    session.query(User).update({User.team_id: None})
+    session.execute(User.__table__.update().values(team_id=None))
     # Also set team_leader_id to NULL for all teams
-    session.query(Team).update({Team.team_leader_id: None})
-    session.commit()
+    session.execute(Team.__table__.update().values(team_leader_id=None))
     
     # Now we can delete teams
-    session.query(Team).delete()
+    session.execute(Team.__table__.delete())
     # Finally delete users
-    session.query(User).delete()
-    session.commit()
+    session.execute(User.__table__.delete())
 
 def insert_dummy_data(session_maker=None, existing_session=None):
     """
     Populates the database with a consistent set of deterministic test data.
     This includes users, teams, properties, and jobs.
     This function clears existing data before seeding to ensure a clean state.
+    All deletes, inserts and sequence fixes run in a single transaction that is
+    rolled back if any step fails, so the database is never left half seeded.
 
     Args:
         session_maker: The SQLAlchemy session factory.
@@ -348,26 +353,31 @@ def insert_dummy_data(session_maker=None, existing_session=None):
     else:
         session = session_maker()
     
-    # Clear existing data
-    delete_jobs_assignments_properties(session)
-    delete_teams_users(session)
-    
-    # Now create new data
-    admin, supervisor, user, team_leader = create_initial_users(session)
-    
-    # Create teams    
-    initial_team, alpha_team, beta_team, charlie_team, delta_team = create_initial_teams(session, admin, supervisor, user, team_leader)    
-    
-    # Create properties
-    anytown_property, teamville_property = create_initial_properties(session)
-    
-    # Create jobs
-    create_initial_jobs(session, anytown_property, teamville_property, admin, user, initial_team, alpha_team, beta_team, charlie_team, delta_team)
-    
-    # Fix PostgreSQL sequences if needed
-    _fix_postgres_sequences(session)
-    
-    session.close()
+    try:
+        # Clear existing data
+        delete_jobs_assignments_properties(session)
+        delete_teams_users(session)
+        
+        # Now create new data
+        admin, supervisor, user, team_leader = create_initial_users(session)
+        
+        # Create teams    
+        initial_team, alpha_team, beta_team, charlie_team, delta_team = create_initial_teams(session, admin, supervisor, user, team_leader)    
+        
+        # Create properties
+        anytown_property, teamville_property = create_initial_properties(session)
+        
+        # Create jobs
+        create_initial_jobs(session, anytown_property, teamville_property, admin, user, initial_team, alpha_team, beta_team, charlie_team, delta_team)
+        
+        # Fix PostgreSQL sequences if needed
+        _fix_postgres_sequences(session)
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
 
 if __name__ == '__main__':
     populate_database(Config.SQLALCHEMY_DATABASE_URI)
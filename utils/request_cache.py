@@ -0,0 +1,20 @@
+from flask import g
+from database import get_db
+
+def request_cached_controller(key, build):
+    """
+    Returns the controller cached on flask.g under key, calling build(db_session) to create
+    it with the request's session on first use.
+
+    Args:
+        key (str): The flask.g attribute to cache the controller under.
+        build (callable): Takes the database session and returns the controller.
+    """
+    db_session = get_db()
+    cached = g.get(key)
+    # Rebuild if the cached controller belongs to a session that has since been torn down
+    if cached is not None and cached[0] is db_session:
+        return cached[1]
+    controller = build(db_session)
+    setattr(g, key, (db_session, controller))
+    return controller
@@ -331,6 +331,9 @@ JOB_TEMPLATES = [
     }
 ]
 
+# Job templates keyed by ID so lookups don't scan the list
+JOB_TEMPLATES_BY_ID = {template['id']: template for template in JOB_TEMPLATES}
+
 # Convenience functions for accessing data
 def get_user_data(user_key):
     """Get user data by key."""
@@ -364,11 +367,7 @@ def get_job_data_by_id(job_id, reference_date=None):
               Returns None if job_id not found.
     """
     # Find the job template
-    job_template = None
-    for template in JOB_TEMPLATES:
-        if template['id'] == job_id:
-            job_template = template
-            break
+    job_template = JOB_TEMPLATES_BY_ID.get(job_id)
     
     if not job_template:
         return None
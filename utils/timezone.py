@@ -36,6 +36,17 @@ def get_app_timezone() -> zoneinfo.ZoneInfo:
         return zoneinfo.ZoneInfo('UTC')
 
 
+def app_tz_is_utc() -> bool:
+    """
+    Check whether the application timezone is UTC, so conversions are no-ops.
+    
+    Returns:
+        bool: True when APP_TIMEZONE is unset or 'UTC'
+    """
+    # Compare the raw setting; cheaper than building the ZoneInfo on hot display paths
+    return os.getenv('APP_TIMEZONE', 'UTC') == 'UTC'
+
+
 def utc_now() -> datetime:
     """
     Get current UTC datetime with timezone awareness.
@@ -139,6 +150,51 @@ def format_in_app_tz(dt: datetime, format_str: str) -> str:
     return app_dt.strftime(format_str)
 
 
+# strftime directives that map onto zero-padded datetime attributes
+_STRFTIME_FIELDS = {
+    'Y': '{0.year:04d}',
+    'm': '{0.month:02d}',
+    'd': '{0.day:02d}',
+    'H': '{0.hour:02d}',
+    'M': '{0.minute:02d}',
+    'S': '{0.second:02d}',
+}
+
+
+def compile_strftime(format_str: str):
+    """
+    Turn a strftime format into a formatter that skips strftime for numeric fields.
+    
+    Formats built only from %Y, %m, %d, %H, %M, %S and %% become a str.format
+    template, which is noticeably cheaper per call. Anything else, e.g. %B, falls
+    back to strftime so locale-aware output is unchanged.
+    
+    Args:
+        format_str: strftime format string
+        
+    Returns:
+        Callable[[datetime], str]: Formats a date, time or datetime like strftime would
+        
+    Example:
+        >>> compile_strftime("%d-%m-%Y")(datetime(2024, 1, 5))
+        '05-01-2024'
+    """
+    parts = []
+    chars = iter(format_str)
+    for char in chars:
+        if char != '%':
+            parts.append(char.replace('{', '{{').replace('}', '}}'))
+            continue
+        directive = next(chars, '')
+        if directive == '%':
+            parts.append('%')
+        elif directive in _STRFTIME_FIELDS:
+            parts.append(_STRFTIME_FIELDS[directive])
+        else:
+            return lambda dt: dt.strftime(format_str)
+    return ''.join(parts).format
+
+
 def parse_to_utc(date_str: str, format_str: str, source_tz: Optional[Union[str, zoneinfo.ZoneInfo]] = None) -> datetime:
     """
     Parse a datetime string and convert to UTC.